@@ -644,25 +644,15 @@ class Processor(ABC, Generic[PROMPT, RESPONSE, PARAMS]):
         :raises MissingPromptAndResponseError: if both prompt and response are missing
         :raises InvalidMultipartFields: if both prompt and response parameters are present
         """
-        matched_input = False
-        matched_response = False
-        matched_input_parameters = False
-        matched_response_parameters = False
-
         for required in REQUIRED_MULTIPART_FIELDS:
             if required not in form:
                 raise MissingMultipartFieldError(field_name=required)
 
-        # Modify the default values of the fields to True if they are present in the form
-        for field in form:
-            if field == INPUT_NAME:
-                matched_input = True
-            if field == RESPONSE_NAME:
-                matched_response = True
-            if field == INPUT_PARAMETERS_NAME:
-                matched_input_parameters = True
-            if field == RESPONSE_PARAMETERS_NAME:
-                matched_response_parameters = True
+        # Form membership is a dict lookup, so check each known field directly
+        matched_input = INPUT_NAME in form
+        matched_response = RESPONSE_NAME in form
+        matched_input_parameters = INPUT_PARAMETERS_NAME in form
+        matched_response_parameters = RESPONSE_PARAMETERS_NAME in form
 
         # We are processing a prompt response ONLY if it contains the RESPONSE_NAME field.
         # Otherwise, implicitly it is a prompt request.
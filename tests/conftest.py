@@ -85,6 +85,21 @@ def data_loader(request):
     return data_loader_factory(request)
 
 
+@pytest.fixture(scope="module")
+def module_data_loader(request):
+    """Load, as a file content factory, the filesystem's file location contents for module-scoped fixtures.
+
+    Behaves as ``data_loader`` does, but searches the test module's directory's data/ path so that it can be used
+    when building data once per module.
+
+    Use:
+        @pytest.fixture(scope="module")
+        def feature_data(module_data_loader):
+            return module_data_loader("feature_file.json")
+    """
+    return data_loader_factory(request)
+
+
 @pytest.fixture
 def url_fx():
     """Get the url_manipulations library as a direct fixture.
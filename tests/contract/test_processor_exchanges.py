@@ -7,7 +7,7 @@ LICENSE file in the root directory of this source tree.
 Verify certain contractual exchanges against a stood up processor.
 """
 
-import io
+import functools
 import json
 from collections import namedtuple
 from collections.abc import Callable
@@ -22,7 +22,6 @@ from urllib3.fields import RequestField
 from f5_ai_gateway_sdk import errors, multipart_fields
 from f5_ai_gateway_sdk.multipart_fields import (
     INPUT_NAME,
-    INPUT_PARAMETERS_NAME,
     METADATA_NAME,
     RESPONSE_NAME,
 )
@@ -40,6 +39,49 @@ PROCESSOR_VERSION = "1"
 PROCESSOR_PATH = f"execute/{PROCESSOR_NAMESPACE}/{PROCESSOR_NAME}"
 SIGNATURE_PATH = f"signature/{PROCESSOR_NAMESPACE}/{PROCESSOR_NAME}"
 CONTENT_TYPE = "application/json"
+HELLO_WORLD_INPUT = RequestInput(messages=[Message(content="hello world")])
+HELLO_WORLD_INPUT_BYTES = HELLO_WORLD_INPUT.__pydantic_serializer__.to_json(
+    HELLO_WORLD_INPUT
+)
+GOODBYE_WORLD_OUTPUT = ResponseOutput(
+    choices=[Choice(message=Message(content="goodbye world"))]
+)
+GOODBYE_WORLD_OUTPUT_BYTES = GOODBYE_WORLD_OUTPUT.__pydantic_serializer__.to_json(
+    GOODBYE_WORLD_OUTPUT
+)
+PROCESSOR_500_ERROR = errors.ProcessorError(
+    http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR, "fool of the fools"
+)
+PROCESSOR_TYPE_ERROR = TypeError("fool of the fools")
+PARAMETERS_MISMATCH_RESPONSE = {
+    "detail": f"response parameters cannot be present with only a {INPUT_NAME} field"
+}
+PROCESSOR_ERROR_RESPONSE = {"detail": "problem executing processor implementation"}
+PROCESSOR_RETURNED_NONE_RESPONSE = {
+    "detail": "Processor[testing:good_judgy] process() method returned None"
+}
+RESPONSE_CREATION_ERROR_RESPONSE = {"detail": "problem creating response object"}
+MISSING_PROMPT_RESPONSE = {
+    "detail": f"{INPUT_NAME} (prompt) and {RESPONSE_NAME} (response) fields are missing -"
+    " at least one is required"
+}
+NULL_PARAMETERS_RESPONSE = {
+    "detail": "invalid parameters submitted",
+    "messages": ["Input should be an object"],
+}
+INVALID_PARAMETERS_RESPONSE = {
+    "detail": "invalid parameters submitted",
+    "messages": ["Input should be a valid boolean: modified"],
+}
+REQUIRED_PARAMETER_MISSING_RESPONSE = {
+    "detail": "invalid parameters submitted",
+    "messages": ["Field required: required_message"],
+}
+EMPTY_METADATA_RESPONSE = {
+    "detail": "Unable to parse JSON field [metadata]: Expecting value: line 1 column 1 (char 0)"
+}
+INVALID_METADATA_RESPONSE = {"detail": "invalid metadata submitted"}
+STRING_METADATA_RESPONSE = {"detail": "metadata must be a JSON object"}
 
 TEST_PROCESSORS = [
     (fake_processors.JudgySync),
@@ -48,601 +90,76 @@ TEST_PROCESSORS = [
 ]
 
 
-def test_multipart_fields_breaking_change():
-    """Verify that the multipart_fields have not changed without this test failing.
-
-    Verifies that SDK does not introduce a breaking change in the multipart field names though the ease of changing
-    something in f5_ai_gateway_sdk.multipart_fields and tests continue to pass here due to the dynamic
-    continuation of these global values.
-
-    THIS IS VITAL for breaking change detection and should be kept up to date as needed as field names change, but
-    the following tests that might identify this type of error will likely not as they use the encoded form.
-    """
-    expected_metadata_name = "metadata"
-    expected_required_multipart_fields = [expected_metadata_name]
-    expected_prompt_name = "input.messages"
-    expected_prompt_parameters_name = "input.parameters"
-    expected_response_name = "response.choices"
-    expected_response_parameters_name = "response.parameters"
-    expected_reject_name = "reject"
-    expected_optional_multipart_fields = [
-        expected_prompt_name,
-        expected_response_name,
-        expected_prompt_parameters_name,
-        expected_response_parameters_name,
-        expected_reject_name,
-    ]
-    assert (
-        encoded_field := multipart_fields.METADATA_NAME
-    ) == expected_metadata_name, (
-        f"breaking change detected: {encoded_field} change from {expected_metadata_name}"
-    )
-    assert (encoded_fields := multipart_fields.INPUT_NAME) == expected_prompt_name, (
-        f"breaking change detected: {encoded_fields} change from {expected_prompt_name}"
-    )
-    assert (
-        encoded_field := multipart_fields.INPUT_PARAMETERS_NAME
-    ) == expected_prompt_parameters_name, (
-        f"breaking change detected: {encoded_field} change from {expected_prompt_parameters_name}"
-    )
-    assert (
-        encoded_field := multipart_fields.RESPONSE_NAME
-    ) == expected_response_name, (
-        f"breaking change detected: {encoded_field} change from {expected_response_name}"
-    )
-    assert (
-        encoded_field := multipart_fields.RESPONSE_PARAMETERS_NAME
-    ) == expected_response_parameters_name, (
-        f"breaking change detected: {encoded_field} change from {expected_response_parameters_name}"
-    )
-    # - validate required versus optional field definitions; order not super important
-    assert (expected := set(expected_required_multipart_fields)) == (
-        result := set(multipart_fields.REQUIRED_MULTIPART_FIELDS)
-    ), f"{result - expected} and {expected - result} should be empty"
-    assert (expected := set(expected_optional_multipart_fields)) == (
-        result := set(multipart_fields.OPTIONAL_MULTIPART_FIELDS)
-    ), f"{result - expected} and {expected - result} should be empty"
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_processor_response_parameters_a_prompt_mismatch(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that response parameters cannot be present with only an input field."""
-    expected_message = (
-        f"response parameters cannot be present with only a {INPUT_NAME} field"
-    )
-    expected_response = f'{{"detail": "{expected_message}"}}'
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = fake_judgy(judgy_class)
-
-    test_logger.info("when: client requests a post with prompt and response parameters")
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.RESPONSE_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    del data[multipart_fields.INPUT_PARAMETERS_NAME]
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_processor_overload_both_parameters(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that providing both input and response parameters generates an error."""
-    expected_message = (
-        f"response parameters cannot be present with only a {INPUT_NAME} field"
-    )
-    expected_response = f'{{"detail": "{expected_message}"}}'
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = fake_judgy(judgy_class)
-
-    test_logger.info(
-        "when: client requests a post with both input and response parameters"
-    )
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    data[multipart_fields.RESPONSE_PARAMETERS_NAME] = data[
-        multipart_fields.INPUT_PARAMETERS_NAME
-    ]
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_processor_500_raising(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that processor errors are properly handled and return a 500 status code."""
-    expected_response = """{"detail": "problem executing processor implementation"}"""
-    expected_status_code = http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = fake_judgy(judgy_class)
-    judgy.raise_error = errors.ProcessorError(
-        http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR, "fool of the fools"
-    )
-
-    test_logger.info(
-        "when: client requests a post with a prompt that causes processor to raise an error"
-    )
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    response = client.send(request)
-    assert response.status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_processor_returns_none(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that processors returning None are handled properly with appropriate error messages."""
-
-    if judgy_class.uses_process_method():
-
-        class NoneReturningProcessor(judgy_class):
-            def process(*_, **__):
-                """Return None as a matter of existence."""
-                return None
-    else:
-
-        class NoneReturningProcessor(judgy_class):
-            def process_input(*_, **__):
-                """Return None as a matter of existence."""
-                return None
-
-            def process_response(*_, **__):
-                """Return None as a matter of existence."""
-                return None
-
-    expected_response = (
-        """{"detail": "Processor[testing:good_judgy] process() method returned None"}"""
-    )
-    expected_status_code = http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = NoneReturningProcessor(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
-    judgy.raise_error = TypeError("fool of the fools")
-
-    test_logger.info(
-        "when: client requests a post with a prompt and processor returns None"
-    )
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_processor_returns_bogus_class(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that processors returning invalid objects are handled properly with appropriate error messages."""
-
-    class BogusClass:
-        rejected = False
-        modified = False
-        metadata = {}
-        processor_result = {}
-        tags = Tags()
-        """Bogus class placeholder that is not a valid response object."""
-
-    if judgy_class.uses_process_method():
-
-        class BogusClassReturningProcessor(judgy_class):
-            """Bogus processor whose process method returns BogusClass type."""
-
-            def process(*_, **__):
-                """Return BogusClass type as a matter of existence."""
-                return BogusClass()
-    else:
-
-        class BogusClassReturningProcessor(judgy_class):
-            """Bogus processor whose process method returns BogusClass type."""
-
-            def process_input(*_, **__):
-                """Return BogusClass type as a matter of existence."""
-                return BogusClass()
-
-    expected_response = """{"detail": "problem creating response object"}"""
-    expected_status_code = http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = BogusClassReturningProcessor(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
-    judgy.raise_error = TypeError("fool of the fools")
-
-    test_logger.info(
-        "when: client requests a post with a prompt and processor returns invalid object"
-    )
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_raising_processor(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that with a stood up processor that the request will return 500 when it crashes."""
-    expected_response = """{"detail": "problem executing processor implementation"}"""
-    expected_status_code = http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
-    judgy.raise_error = TypeError("fool of the fools")
-
-    test_logger.info(
-        "when: client requests a post with a prompt that causes processor to raise an error"
-    )
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
-
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_no_prompt(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that with a stood up processor that the request will reject a request with no prompt."""
-    expected_error = (
-        f'{{"detail": "{INPUT_NAME} (prompt) and {RESPONSE_NAME} (response) fields are missing -'
-        f' at least one is required"}}'
-    )
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
-
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
-
-    test_logger.info("when: client requests a post with no prompt")
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(data_loader, metadata="{}", parameters="{}")
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
-
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_error} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_error, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_error}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
-
+@pytest.fixture(
+    scope="module",
+    params=TEST_PROCESSORS,
+    ids=[processor.__name__ for processor in TEST_PROCESSORS],
+)
+def judgy_class(request):
+    """Get each of the Judgy processor implementations under test."""
+    return request.param
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_null_parameters(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that null parameters are properly validated and rejected."""
-    expected_response = """{"detail": "invalid parameters submitted", "messages": ["Input should be an object"]}"""
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
 
-    method = "post"
+@pytest.fixture(scope="module")
+def judgy(judgy_class):
+    """Get a Judgy shared across the module's tests for the given judgy_class."""
+    return fake_judgy(judgy_class)
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
 
-    test_logger.info("when: client requests a post with null parameters")
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters="{}",
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = b"null"
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+@pytest.fixture(scope="module")
+def processor_client(judgy, processor_client_loader):
+    """Get a client stood up once per module against the shared Judgy."""
+    return processor_client_loader(judgy)
 
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
 
+@pytest.fixture(scope="module")
+def required_judgy(judgy_class):
+    """Get a Judgy that requires parameters shared across the module's tests."""
+    return fake_judgy(judgy_class, fake_processors.JudgyRequiredParameters)
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_empty_metadata(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that empty metadata is properly handled."""
-    expected_response = '{"detail": "Unable to parse JSON field [metadata]: Expecting value: line 1 column 1 (char 0)"}'
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
 
-    method = "post"
+@pytest.fixture(scope="module")
+def required_processor_client(required_judgy, processor_client_loader):
+    """Get a client stood up once per module against the shared required Judgy."""
+    return processor_client_loader(required_judgy)
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
 
-    test_logger.info("when: client requests a post with empty metadata")
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-    )
-    data[multipart_fields.METADATA_NAME] = b""
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+@pytest.fixture(scope="module")
+def judgy_parameters(module_data_loader):
+    """Get the Judgy parameters test data, parsed once per module; copy it before changing it."""
+    return module_data_loader("judgy_parameters.yaml")
 
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
-    )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
-    )
 
+@pytest.fixture(scope="module")
+def judgy_parameters_json(judgy_parameters):
+    """Get the Judgy parameters test data as a JSON document."""
+    return json.dumps(judgy_parameters)
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_invalid_metadata(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
-    """Verify that invalid metadata format is properly rejected."""
-    expected_response = """{"detail": "invalid metadata submitted"}"""
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
 
-    method = "post"
+@pytest.fixture(scope="module")
+def base_prompt_content(module_data_loader, judgy_parameters_json):
+    """Get the canonical metadata, prompt, and Judgy parameters request fields.
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
+    Tests needing a variation copy this and change only the fields they exercise.
+    """
+    return build_processor_prompt_content(
+        module_data_loader,
+        prompt=HELLO_WORLD_INPUT_BYTES,
+        metadata="{}",
+        parameters=judgy_parameters_json,
     )
 
-    test_logger.info("when: client requests a post with invalid metadata")
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-    )
-    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
-        data_loader("judgy_parameters.yaml")
-    )
+
+@pytest.fixture(scope="module")
+def base_multipart(base_prompt_content):
+    """Get the multipart header and content framed once from base_prompt_content."""
+    return multipart_framing_bytes(base_prompt_content)
+
+
+@pytest.fixture(scope="module")
+def invalid_metadata_multipart(base_prompt_content):
+    """Get the multipart header and content of a request whose metadata is framed as a jpeg attachment."""
+    data = dict(base_prompt_content)
     data[multipart_fields.INPUT_NAME] = RequestField(
         multipart_fields.INPUT_NAME,
         data[multipart_fields.INPUT_NAME],
@@ -669,308 +186,401 @@ def test_request_invalid_metadata(
         "image/jpeg",
         "meta.jpeg",
     )
-    header, retrieval = multipart_framing([value for value in data.values()])
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+    return multipart_framing_bytes(list(data.values()))
 
-    test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
+
+@pytest.fixture
+def raising_judgy(judgy):
+    """Get the shared Judgy, clearing any error a test armed it with afterwards."""
+    yield judgy
+    judgy.raise_error = None
+
+
+def test_multipart_fields_breaking_change():
+    """Verify that the multipart_fields have not changed without this test failing.
+
+    Verifies that SDK does not introduce a breaking change in the multipart field names though the ease of changing
+    something in f5_ai_gateway_sdk.multipart_fields and tests continue to pass here due to the dynamic
+    continuation of these global values.
+
+    THIS IS VITAL for breaking change detection and should be kept up to date as needed as field names change, but
+    the following tests that might identify this type of error will likely not as they use the encoded form.
+    """
+    expected_metadata_name = "metadata"
+    expected_required_multipart_fields = [expected_metadata_name]
+    expected_prompt_name = "input.messages"
+    expected_prompt_parameters_name = "input.parameters"
+    expected_response_name = "response.choices"
+    expected_response_parameters_name = "response.parameters"
+    expected_reject_name = "reject"
+    expected_optional_multipart_fields = [
+        expected_prompt_name,
+        expected_response_name,
+        expected_prompt_parameters_name,
+        expected_response_parameters_name,
+        expected_reject_name,
+    ]
+    assert (
+        encoded_field := multipart_fields.METADATA_NAME
+    ) == expected_metadata_name, (
+        f"breaking change detected: {encoded_field} change from {expected_metadata_name}"
     )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
+    assert (encoded_fields := multipart_fields.INPUT_NAME) == expected_prompt_name, (
+        f"breaking change detected: {encoded_fields} change from {expected_prompt_name}"
     )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
+    assert (
+        encoded_field := multipart_fields.INPUT_PARAMETERS_NAME
+    ) == expected_prompt_parameters_name, (
+        f"breaking change detected: {encoded_field} change from {expected_prompt_parameters_name}"
     )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
+    assert (
+        encoded_field := multipart_fields.RESPONSE_NAME
+    ) == expected_response_name, (
+        f"breaking change detected: {encoded_field} change from {expected_response_name}"
+    )
+    assert (
+        encoded_field := multipart_fields.RESPONSE_PARAMETERS_NAME
+    ) == expected_response_parameters_name, (
+        f"breaking change detected: {encoded_field} change from {expected_response_parameters_name}"
     )
+    # - validate required versus optional field definitions; order not super important
+    assert (expected := set(expected_required_multipart_fields)) == (
+        result := set(multipart_fields.REQUIRED_MULTIPART_FIELDS)
+    ), f"{result - expected} and {expected - result} should be empty"
+    assert (expected := set(expected_optional_multipart_fields)) == (
+        result := set(multipart_fields.OPTIONAL_MULTIPART_FIELDS)
+    ), f"{result - expected} and {expected - result} should be empty"
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_string_metadata(
-    data_loader, processor_client_loader, test_logger, judgy_class
+ErrorExchange = namedtuple(
+    "ErrorExchange",
+    "raise_error, data_mutator, expected_status_code, expected_response",
+)
+ERROR_EXCHANGES = {
+    "response_parameters_a_prompt_mismatch": ErrorExchange(
+        None,
+        lambda data: data.update(
+            {
+                multipart_fields.RESPONSE_PARAMETERS_NAME: data.pop(
+                    multipart_fields.INPUT_PARAMETERS_NAME
+                )
+            }
+        ),
+        http_status_codes.HTTP_400_BAD_REQUEST,
+        PARAMETERS_MISMATCH_RESPONSE,
+    ),
+    "overload_both_parameters": ErrorExchange(
+        None,
+        lambda data: data.update(
+            {
+                multipart_fields.RESPONSE_PARAMETERS_NAME: data[
+                    multipart_fields.INPUT_PARAMETERS_NAME
+                ]
+            }
+        ),
+        http_status_codes.HTTP_400_BAD_REQUEST,
+        PARAMETERS_MISMATCH_RESPONSE,
+    ),
+    "processor_500_raising": ErrorExchange(
+        PROCESSOR_500_ERROR,
+        None,
+        http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR,
+        PROCESSOR_ERROR_RESPONSE,
+    ),
+    "raising_processor": ErrorExchange(
+        PROCESSOR_TYPE_ERROR,
+        None,
+        http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR,
+        PROCESSOR_ERROR_RESPONSE,
+    ),
+    "no_prompt": ErrorExchange(
+        None,
+        lambda data: data.pop(INPUT_NAME),
+        http_status_codes.HTTP_400_BAD_REQUEST,
+        MISSING_PROMPT_RESPONSE,
+    ),
+    "null_parameters": ErrorExchange(
+        None,
+        lambda data: data.update({multipart_fields.INPUT_PARAMETERS_NAME: b"null"}),
+        http_status_codes.HTTP_400_BAD_REQUEST,
+        NULL_PARAMETERS_RESPONSE,
+    ),
+    "empty_metadata": ErrorExchange(
+        None,
+        lambda data: data.update({METADATA_NAME: b""}),
+        http_status_codes.HTTP_400_BAD_REQUEST,
+        EMPTY_METADATA_RESPONSE,
+    ),
+    "string_metadata": ErrorExchange(
+        None,
+        lambda data: data.update(
+            {METADATA_NAME: b"null", INPUT_NAME: b"Why are dogs so friendly?"}
+        ),
+        http_status_codes.HTTP_400_BAD_REQUEST,
+        STRING_METADATA_RESPONSE,
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def error_exchange_multiparts(base_prompt_content, base_multipart):
+    """Get each ERROR_EXCHANGES scenario's multipart header and content, framed once per module."""
+    framed = {}
+    for name, exchange in ERROR_EXCHANGES.items():
+        if exchange.data_mutator is None:
+            framed[name] = base_multipart
+            continue
+        exchange.data_mutator(data := dict(base_prompt_content))
+        framed[name] = multipart_framing_bytes(data)
+    return framed
+
+
+@pytest.mark.parametrize("exchange_name", ERROR_EXCHANGES)
+def test_processor_error_exchanges(
+    exchange_name,
+    error_exchange_multiparts,
+    raising_judgy,
+    processor_client,
+    test_logger,
 ):
-    """Verify that string metadata (instead of JSON object) is properly rejected."""
-    expected_response = """{"detail": "metadata must be a JSON object"}"""
-    expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
+    """Verify that bad requests and failing processors are answered with the expected error response.
 
-    method = "post"
+    Each scenario either arms the shared Judgy with an error to raise, mutates a copy of the canonical request
+    fields, or both; scenarios that change neither send the canonical request framed once per module.
+    """
+    exchange = ERROR_EXCHANGES[exchange_name]
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
+    raising_judgy.raise_error = exchange.raise_error
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = fake_judgy(judgy_class)
+    test_logger.info("when: client requests a post with the %s request", exchange_name)
+    header, content = error_exchange_multiparts[exchange_name]
 
-    test_logger.info("when: client requests a post with string metadata")
-    client = processor_client_loader(judgy)
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
+    test_logger.info(
+        "then: response should have %s code and %s prompt",
+        exchange.expected_status_code,
+        exchange.expected_response,
     )
-    data[METADATA_NAME] = b"null"
-    data[INPUT_NAME] = b"Why are dogs so friendly?"
-    data[INPUT_PARAMETERS_NAME] = json.dumps(data_loader("judgy_parameters.yaml"))
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
+    response = processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
     )
+    assert_error_response(
+        response, content, exchange.expected_status_code, exchange.expected_response
+    )
+
+
+def test_processor_returns_none(
+    base_multipart, processor_client_loader, test_logger, judgy_class
+):
+    """Verify that processors returning None are handled properly with appropriate error messages."""
+    expected_status_code = http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR
+
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
+    judgy = fake_judgy(none_returning_processor(judgy_class))
+    judgy.raise_error = PROCESSOR_TYPE_ERROR
 
     test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_response} prompt"
+        "when: client requests a post with a prompt and processor returns None"
     )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
+    client = processor_client_loader(judgy, memoize=False)
+    header, content = base_multipart
+
+    test_logger.info(
+        "then: response should have %s code and %s prompt",
+        expected_status_code,
+        PROCESSOR_RETURNED_NONE_RESPONSE,
     )
-    assert (result := response.text) == expected_response, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
+    response = client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
     )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
+    assert_error_response(
+        response, content, expected_status_code, PROCESSOR_RETURNED_NONE_RESPONSE
     )
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_query_get_command(processor_client_loader, test_logger, judgy_class):
-    """Verify that with a ?command=parameters we get the parameters back."""
-    expected_status_code = http_status_codes.HTTP_200_OK
-
-    method = "get"
+def test_processor_returns_bogus_class(
+    base_multipart, processor_client_loader, test_logger, judgy_class
+):
+    """Verify that processors returning invalid objects are handled properly with appropriate error messages."""
+    expected_status_code = http_status_codes.HTTP_500_INTERNAL_SERVER_ERROR
 
-    test_logger.info(f"given: processor with path: {SIGNATURE_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
+    judgy = fake_judgy(bogus_class_returning_processor(judgy_class))
+    judgy.raise_error = PROCESSOR_TYPE_ERROR
 
     test_logger.info(
-        f"when: client requests a get with no prompt, and the query {SIGNATURE_PATH}"
+        "when: client requests a post with a prompt and processor returns invalid object"
     )
-    client = processor_client_loader(judgy)
+    client = processor_client_loader(judgy, memoize=False)
+    header, content = base_multipart
 
     test_logger.info(
-        "then: request response should be {expected_status_code}: {expected_error}"
+        "then: response should have %s code and %s prompt",
+        expected_status_code,
+        RESPONSE_CREATION_ERROR_RESPONSE,
     )
-    response = client.get(SIGNATURE_PATH)
-
-    assert response.status_code == expected_status_code, (
-        f"{response.status_code} != {expected_status_code} for {method}({response.url})"
+    response = client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
+    )
+    assert_error_response(
+        response, content, expected_status_code, RESPONSE_CREATION_ERROR_RESPONSE
     )
-    assert response.json()["parameters"] == judgy.parameters_class.model_json_schema()
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_query_post_command_invalid_json(
-    processor_client_loader, test_logger, judgy_class
+def test_request_invalid_metadata(
+    invalid_metadata_multipart, processor_client, test_logger
 ):
-    """Verify that with a ?command=parameters we get the parameters back."""
+    """Verify that invalid metadata format is properly rejected."""
     expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
 
-    method = "post"
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
 
-    test_logger.info(f"given: processor with path: {SIGNATURE_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyRequiredParameters,
-    )
+    test_logger.info("when: client requests a post with invalid metadata")
+    header, content = invalid_metadata_multipart
 
     test_logger.info(
-        f"when: client requests a get with no prompt, and the query {SIGNATURE_PATH}"
+        "then: response should have %s code and %s prompt",
+        expected_status_code,
+        INVALID_METADATA_RESPONSE,
+    )
+    response = processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
     )
-    client = processor_client_loader(judgy)
+    assert_error_response(
+        response, content, expected_status_code, INVALID_METADATA_RESPONSE
+    )
+
+
+def test_request_query_get_command(judgy, processor_client, test_logger):
+    """Verify that with a ?command=parameters we get the parameters back."""
+    expected_status_code = http_status_codes.HTTP_200_OK
+
+    method = "get"
+
+    test_logger.info("given: processor with path: %s", SIGNATURE_PATH)
 
     test_logger.info(
-        "then: request response should be {expected_status_code}: {expected_error}"
+        "when: client requests a get with no prompt, and the query %s", SIGNATURE_PATH
     )
-    request = client.build_request(
-        url=SIGNATURE_PATH,
-        method=method,
-        headers={"Content-Type": "application/json"},
-        content="",
-    )
-    response = client.send(request)
+
+    test_logger.info("then: request response should be %s", expected_status_code)
+    response = processor_client.get(SIGNATURE_PATH)
 
     assert response.status_code == expected_status_code, (
         f"{response.status_code} != {expected_status_code} for {method}({response.url})"
     )
-    result = response.json()
-    assert result["parameters"] == judgy.parameters_class.model_json_schema()
-    assert not result["validation"]["valid"]
-    assert result["validation"]["errors"] == [
-        "Invalid JSON: EOF while parsing a value at line 1 column 0"
-    ]
+    assert response.json()["parameters"] == parameters_schema(judgy.parameters_class)
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_request_query_post_command_invalid_parameters(
-    processor_client_loader, test_logger, judgy_class
+@pytest.mark.parametrize(
+    "content, expected_errors",
+    [
+        ("", ["Invalid JSON: EOF while parsing a value at line 1 column 0"]),
+        ('{"message":"test"}', ["Field required: required_message"]),
+    ],
+    ids=["invalid_json", "invalid_parameters"],
+)
+def test_request_query_post_command_invalid(
+    content, expected_errors, required_judgy, required_processor_client, test_logger
 ):
-    """Verify that with a ?command=parameters we get the parameters back."""
+    """Verify that posting invalid parameters to the signature gets the parameters schema and the errors back."""
     expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
 
     method = "post"
 
-    test_logger.info(f"given: processor with path: {SIGNATURE_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyRequiredParameters,
-    )
+    test_logger.info("given: processor with path: %s", SIGNATURE_PATH)
 
     test_logger.info(
-        f"when: client requests a get with no prompt, and the query {SIGNATURE_PATH}"
+        "when: client posts %r as parameters to the query %s", content, SIGNATURE_PATH
     )
-    client = processor_client_loader(judgy)
 
-    test_logger.info(
-        "then: request response should be {expected_status_code}: {expected_error}"
+    test_logger.info("then: request response should be %s", expected_status_code)
+    response = required_processor_client.post(
+        SIGNATURE_PATH, headers={"Content-Type": "application/json"}, content=content
     )
-    request = client.build_request(
-        url=SIGNATURE_PATH,
-        method=method,
-        headers={"Content-Type": "application/json"},
-        content='{"message":"test"}',
-    )
-    response = client.send(request)
 
     assert response.status_code == expected_status_code, (
         f"{response.status_code} != {expected_status_code} for {method}({response.url})"
     )
     result = response.json()
-    assert result["parameters"] == judgy.parameters_class.model_json_schema()
+    assert result["parameters"] == parameters_schema(required_judgy.parameters_class)
     assert not result["validation"]["valid"]
-    assert result["validation"]["errors"] == ["Field required: required_message"], (
-        result["validation"]["errors"]
-    )
+    assert result["validation"]["errors"] == expected_errors, result["validation"][
+        "errors"
+    ]
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
 def test_request_invalid_parameters(
-    data_loader, processor_client_loader, test_logger, judgy_class
+    base_prompt_content, judgy_parameters, processor_client, test_logger
 ):
     """Verify that invalid parameters are properly validated and rejected."""
-    expected_error = """{"detail": "invalid parameters submitted", "messages": ["Input should be a valid boolean: modified"]}"""
     expected_status_code = http_status_codes.HTTP_400_BAD_REQUEST
 
-    method = "post"
-
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
 
     test_logger.info("when: client requests a post with invalid parameters")
-    client = processor_client_loader(judgy)
-    parameters = data_loader("judgy_parameters.yaml")
-    parameters["modified"] = "Lucy in the sky with diamonds"
-    data = build_processor_prompt_content(
-        data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        metadata="{}",
-        parameters=parameters,
-    )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
+    data = dict(base_prompt_content)
+    data[multipart_fields.INPUT_PARAMETERS_NAME] = json.dumps(
+        {**judgy_parameters, "modified": "Lucy in the sky with diamonds"}
     )
+    header, content = multipart_framing_bytes(data)
 
     test_logger.info(
-        f"then: response should have {expected_status_code} code and {expected_error} prompt"
+        "then: response should have %s code and %s prompt",
+        expected_status_code,
+        INVALID_PARAMETERS_RESPONSE,
     )
-    assert (response := client.send(request)).status_code == expected_status_code, (
-        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
-    )
-    assert (result := response.text) == expected_error, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_error}: {content}"
+    response = processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
     )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
+    assert_error_response(
+        response, content, expected_status_code, INVALID_PARAMETERS_RESPONSE
     )
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
 def test_request_required_parameters_missing(
-    data_loader, processor_client_loader, test_logger, judgy_class
+    data_loader, required_processor_client, test_logger
 ):
     """Verify that missing required parameters are properly validated and rejected."""
-    expected_error = """{"detail": "invalid parameters submitted", "messages": ["Field required: required_message"]}"""
     expected_invalid_status_code = http_status_codes.HTTP_400_BAD_REQUEST
-    method = "post"
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyRequiredParameters,
-    )
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
 
     test_logger.info("when: client requests a post without a required parameter")
-    client = processor_client_loader(judgy)
     parameters_missing_required = {"reject": False}
     data = build_processor_prompt_content(
         data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
+        prompt=HELLO_WORLD_INPUT_BYTES,
         metadata="{}",
         parameters=parameters_missing_required,
     )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+    header, content = multipart_framing_bytes(data)
 
     test_logger.info(
-        f"then: response should have {expected_invalid_status_code} code and {expected_error} prompt"
+        "then: response should have %s code and %s prompt",
+        expected_invalid_status_code,
+        REQUIRED_PARAMETER_MISSING_RESPONSE,
     )
-    response = client.send(request)
-    assert response.status_code == expected_invalid_status_code, (
-        f"({response.status_code} != {expected_invalid_status_code}) from {method}({PROCESSOR_PATH}): {content}"
+    response = required_processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
     )
-    assert (result := response.text) == expected_error, (
-        f"{method}{PROCESSOR_PATH} had mismatching errors \n{result} \nvs \n{expected_error}: {content}"
-    )
-    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
-        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
+    assert_error_response(
+        response,
+        content,
+        expected_invalid_status_code,
+        REQUIRED_PARAMETER_MISSING_RESPONSE,
     )
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
 def test_request_required_parameters_present(
-    data_loader, processor_client_loader, test_logger, judgy_class
+    data_loader, required_processor_client, test_logger
 ):
     """Verify that requests with required parameters present are handled correctly."""
     expected_valid_status_code = http_status_codes.HTTP_400_BAD_REQUEST
     method = "post"
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyRequiredParameters,
-    )
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
 
     test_logger.info("when: client requests a post without a required parameter")
-    client = processor_client_loader(judgy)
     parameters_with_required = {"reject": False, "required_message": "hello world"}
     data = build_processor_prompt_content(
         data_loader,
@@ -978,16 +588,12 @@ def test_request_required_parameters_present(
         metadata="{}",
         parameters=parameters_with_required,
     )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+    header, content = multipart_framing_bytes(data)
 
-    test_logger.info(f"then: response should have {expected_valid_status_code} code")
-    response = client.send(request)
+    test_logger.info("then: response should have %s code", expected_valid_status_code)
+    response = required_processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
+    )
     assert response.status_code == expected_valid_status_code, (
         f"({response.status_code} != {expected_valid_status_code}) from {method}({PROCESSOR_PATH}): {content}"
     )
@@ -997,35 +603,28 @@ def test_request_required_parameters_present(
     )
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
 def test_request_required_metadata_response_fields(
-    data_loader, processor_client_loader, test_logger, judgy_class
+    data_loader, processor_client, test_logger
 ):
     """Verify that metadata responses contain required fields."""
     expected_valid_status_code = http_status_codes.HTTP_200_OK
     method = "post"
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = fake_judgy(judgy_class)
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
 
     test_logger.info("when: client requests a post without a required parameter")
-    client = processor_client_loader(judgy)
     data = build_processor_prompt_content(
         data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
+        prompt=HELLO_WORLD_INPUT_BYTES,
         metadata="{}",
         parameters={"skip_metadata": True, "modified": True},
     )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+    header, content = multipart_framing_bytes(data)
 
-    test_logger.info(f"then: response should have {expected_valid_status_code} code")
-    response = client.send(request)
+    test_logger.info("then: response should have %s code", expected_valid_status_code)
+    response = processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
+    )
     assert response.status_code == expected_valid_status_code, (
         f"({response.status_code} != {expected_valid_status_code}) from {method}({PROCESSOR_PATH}): {content}"
     )
@@ -1033,107 +632,73 @@ def test_request_required_metadata_response_fields(
     assert "processor_version" in response.text
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
 def test_request_required_parameters_missing_multipart(
-    data_loader, processor_client_loader, test_logger, judgy_class
+    data_loader, required_processor_client, test_logger
 ):
     """Verify that missing required parameters in multipart requests are properly validated and rejected."""
-    expected_error = """{"detail": "invalid parameters submitted", "messages": ["Field required: required_message"]}"""
     expected_valid_status_code = http_status_codes.HTTP_400_BAD_REQUEST
-    method = "post"
 
-    test_logger.info(f"given: processor with path: {PROCESSOR_PATH}")
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyRequiredParameters,
-    )
+    test_logger.info("given: processor with path: %s", PROCESSOR_PATH)
 
     test_logger.info("when: client requests a post with no params but a required field")
-    client = processor_client_loader(judgy)
     data = build_processor_prompt_content(
         data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
+        prompt=HELLO_WORLD_INPUT_BYTES,
         metadata="{}",
     )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+    header, content = multipart_framing_bytes(data)
 
     test_logger.info(
-        f"then: response should have {expected_valid_status_code} code and {expected_error} prompt"
+        "then: response should have %s code and %s prompt",
+        expected_valid_status_code,
+        REQUIRED_PARAMETER_MISSING_RESPONSE,
     )
-    response = client.send(request)
-    assert response.status_code == expected_valid_status_code, (
-        f"({response.status_code} != {expected_valid_status_code}) from {method}({PROCESSOR_PATH}): {content}"
+    response = required_processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
     )
-    assert response.text == expected_error, (
-        f"expected '{expected_error}' but got '{response.text}'"
+    assert_error_response(
+        response,
+        content,
+        expected_valid_status_code,
+        REQUIRED_PARAMETER_MISSING_RESPONSE,
     )
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_modification_with_reject(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
+def test_modification_with_reject(data_loader, processor_client, test_logger):
     """Verify that processors allow modify and reject to be set at once."""
     expected_valid_status_code = http_status_codes.HTTP_200_OK
     method = "post"
 
-    judgy = judgy_class(
-        PROCESSOR_NAME,
-        PROCESSOR_VERSION,
-        PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
-    )
-    client = processor_client_loader(judgy)
     data = build_processor_prompt_content(
         data_loader,
-        prompt=RequestInput(messages=[Message(content="hello world")]),
-        response=ResponseOutput(
-            choices=[Choice(message=Message(content="goodbye world"))]
-        ),
+        prompt=HELLO_WORLD_INPUT_BYTES,
+        response=GOODBYE_WORLD_OUTPUT_BYTES,
         parameters={"reject": True, "modify": True},
         metadata="{}",
     )
-    header, retrieval = multipart_framing(data)
-    request = client.build_request(
-        url=PROCESSOR_PATH,
-        method=method,
-        headers={"Content-Type": header},
-        content=(content := retrieval()),
-    )
+    header, content = multipart_framing_bytes(data)
 
-    test_logger.info(f"then: response should have {expected_valid_status_code} code")
-    response = client.send(request)
+    test_logger.info("then: response should have %s code", expected_valid_status_code)
+    response = processor_client.post(
+        PROCESSOR_PATH, headers={"Content-Type": header}, content=content
+    )
     assert response.status_code == expected_valid_status_code, (
         f"({response.status_code} != {expected_valid_status_code}) from {method}({PROCESSOR_PATH}): {content}"
     )
 
 
-@pytest.mark.parametrize("judgy_class", TEST_PROCESSORS)
-def test_get_signature_definition(
-    data_loader, processor_client_loader, test_logger, judgy_class
-):
+def test_get_signature_definition(judgy, processor_client, test_logger):
     """Assure that the signature returned from the processor /signature endpoint matches the processor's signature"""
     expected_status_code = http_status_codes.HTTP_200_OK
     method = "get"
 
-    test_logger.info(f"given: processor with path: {SIGNATURE_PATH}")
-    judgy = fake_judgy(judgy_class)
+    test_logger.info("given: processor with path: %s", SIGNATURE_PATH)
     test_logger.info("when: client requests signature definition")
-    client = processor_client_loader(judgy)
-    request = client.build_request(
-        url=SIGNATURE_PATH, method=method, headers={"Accept": "application/json"}
-    )
 
-    test_logger.info(f"then: response should have {expected_status_code} code")
-    response = client.send(request)
+    test_logger.info("then: response should have %s code", expected_status_code)
+    response = processor_client.get(
+        SIGNATURE_PATH, headers={"Accept": "application/json"}
+    )
 
     assert expected_status_code == response.status_code, (
         f"({response.status_code}) from {method}({SIGNATURE_PATH})"
@@ -1142,32 +707,47 @@ def test_get_signature_definition(
     assert signature_as_json == judgy.signature.to_list()
 
 
+@functools.cache
+def parameters_schema(parameters_class: type[Parameters]) -> dict:
+    """Get, generated once per class, the JSON schema a processor's signature reports for its parameters."""
+    return parameters_class.model_json_schema()
+
+
+FIELD_ENCODERS: dict[type, Callable[[Any], bytes]] = {
+    bytes: lambda given: given,
+    str: str.encode,
+    list: lambda given: json.dumps(given).encode(),
+    dict: lambda given: json.dumps(given).encode(),
+}
+
+
 def build_processor_prompt_content(
     data_loader: Callable[[str], Any],
     metadata: AnyStr | None = None,
-    prompt: RequestInput | None = None,
+    prompt: RequestInput | bytes | None = None,
     parameters: Parameters | None = None,
-    response: ResponseOutput | None = None,
+    response: ResponseOutput | bytes | None = None,
     **other,
 ) -> dict[str, AnyStr | bytes | RequestField]:
     """Build the content for a request from the provided, anticipated fields."""
 
     def encode_to_bytes(given) -> bytes:
         """Encode the given into a bytes format."""
-        if isinstance(given, (expected := bytes)):
-            return given
-        if isinstance(given, (expected := (str, expected))):
-            return given.encode()
-        if isinstance(given, (expected := (list, dict, *expected))):
-            return json.dumps(given).encode()
-        if issubclass(type(given), BaseModel):
-            return bytes(given.model_dump_json(), "utf-8")
-        raise TestTypeError(given=type(given), expected=type(expected))
+        if (encoder := FIELD_ENCODERS.get(type(given))) is not None:
+            return encoder(given)
+        if isinstance(given, BaseModel):
+            # - pydantic-core serializes straight to bytes, skipping model_dump_json()'s str round trip
+            return given.__pydantic_serializer__.to_json(given)
+        # - subclasses of the encodable types miss the exact type lookup
+        for encodable, encoder in FIELD_ENCODERS.items():
+            if isinstance(given, encodable):
+                return encoder(given)
+        raise TestTypeError(given=given, expected=(*FIELD_ENCODERS, BaseModel))
 
     def screen_other():
         """Screens the content of ``other``."""
         for field, entry in other.items():
-            yield field, encode_to_bytes(entry)
+            yield field, encode_to_bytes(entry).strip()
 
     fields = {}
     if metadata:
@@ -1184,36 +764,100 @@ def build_processor_prompt_content(
         ] = encode_to_bytes(parameters)
 
     fields.update({field: entry for field, entry in screen_other()})
-    return {field: entry.strip() for field, entry in fields.items()}
+    return fields
 
 
-def multipart_framing(multipart_prompt, chunk=None, as_iterator=False):
-    """Get a multipart header and prompt retreiever method."""
-    multipart = namedtuple("Multipart", "header, retrieve_prompt")
-    prompt, header = urllib3.encode_multipart_formdata(multipart_prompt)
+def multipart_framing_bytes(multipart_prompt) -> tuple[str, bytes]:
+    """Get a multipart header and the framed prompt's bytes for sending as-is."""
+    if isinstance(multipart_prompt, dict):
+        multipart_prompt = multipart_prompt.items()
+    return encode_multipart_fields(tuple(multipart_prompt))
 
-    def retrieval_iterator():
-        reader = io.BytesIO(prompt)
-        if chunk is None:
-            for line in iter(reader):
-                yield line
-        else:
-            reader = io.BytesIO(prompt)
-            while contents := reader.read(chunk):
-                yield contents
 
-    def retrieval():
-        return prompt
+@functools.lru_cache(maxsize=256)
+def encode_multipart_fields(fields: tuple) -> tuple[str, bytes]:
+    """Encode, once per distinct ordered fields, the multipart header and bytes."""
+    prompt, header = urllib3.encode_multipart_formdata(fields)
+    return header, prompt
 
-    if as_iterator:
-        return multipart(header, retrieval_iterator)
-    return multipart(header, retrieval)
 
-
-def fake_judgy(judgy_class=fake_processors.JudgySync) -> fake_processors.JudgySync:
+def fake_judgy(
+    judgy_class=fake_processors.JudgySync,
+    parameters_class=fake_processors.JudgyParameters,
+) -> fake_processors.JudgySync:
     return judgy_class(
         PROCESSOR_NAME,
         PROCESSOR_VERSION,
         PROCESSOR_NAMESPACE,
-        parameters_class=fake_processors.JudgyParameters,
+        parameters_class=parameters_class,
+    )
+
+
+class BogusClass:
+    """Bogus class placeholder that is not a valid response object."""
+
+    rejected = False
+    modified = False
+    metadata = {}
+    processor_result = {}
+    tags = Tags()
+
+
+@functools.cache
+def none_returning_processor(judgy_class):
+    """Get, once per judgy_class, a subclass of it whose processing returns None."""
+    if judgy_class.uses_process_method():
+
+        class NoneReturningProcessor(judgy_class):
+            def process(*_, **__):
+                """Return None as a matter of existence."""
+                return None
+    else:
+
+        class NoneReturningProcessor(judgy_class):
+            def process_input(*_, **__):
+                """Return None as a matter of existence."""
+                return None
+
+            def process_response(*_, **__):
+                """Return None as a matter of existence."""
+                return None
+
+    return NoneReturningProcessor
+
+
+@functools.cache
+def bogus_class_returning_processor(judgy_class):
+    """Get, once per judgy_class, a subclass of it whose processing returns a BogusClass."""
+    if judgy_class.uses_process_method():
+
+        class BogusClassReturningProcessor(judgy_class):
+            """Bogus processor whose process method returns BogusClass type."""
+
+            def process(*_, **__):
+                """Return BogusClass type as a matter of existence."""
+                return BogusClass()
+    else:
+
+        class BogusClassReturningProcessor(judgy_class):
+            """Bogus processor whose process method returns BogusClass type."""
+
+            def process_input(*_, **__):
+                """Return BogusClass type as a matter of existence."""
+                return BogusClass()
+
+    return BogusClassReturningProcessor
+
+
+def assert_error_response(response, content, expected_status_code, expected_response):
+    """Assert that the response is the expected JSON error for the request content sent."""
+    method = response.request.method
+    assert response.status_code == expected_status_code, (
+        f"({response.status_code}) from {method}({PROCESSOR_PATH}): {content}"
+    )
+    assert (result := response.json()) == expected_response, (
+        f"{method}{PROCESSOR_PATH} had mismatching errors {result} vs {expected_response}: {content}"
+    )
+    assert (content_type := response.headers["Content-Type"]) == CONTENT_TYPE, (
+        f"expected {CONTENT_TYPE} for Content-Type; instead got {content_type}"
     )
@@ -31,7 +31,6 @@ from . import filesystem
 
 
 LOGGER = logging.getLogger(__name__)
-parameters = None
 
 
 class Defaults:
@@ -108,12 +107,12 @@ class Parameters(configparser.ConfigParser):
         self[environment]["record_dir"] = str(
             (record_dir := record_dir.joinpath(f"{dir_create_stamp}_{execution_id}"))
         )
-        record_dir.mkdir(parents=True, exist_ok=True)
         self[environment]["log_dir"] = str((log_dir := record_dir.joinpath("logs")))
-        log_dir.mkdir(exist_ok=True)
         self["environment"]["template_dir"] = str(
             (template_dir := record_dir.joinpath("templates"))
         )
+        # - the leaves' parents=True creates the shared record_dir along the way
+        log_dir.mkdir(parents=True, exist_ok=True)
         template_dir.mkdir(exist_ok=True)
         with open(record_dir.joinpath("config_used.cfg"), "w") as out:
             self.write(out)
@@ -126,5 +125,13 @@ def setup_parameters() -> types.SimpleNamespace:
     )
 
 
-parameters = setup_parameters()
-__all__ = [parameters]
+def __getattr__(name: str) -> typing.Any:
+    """Set up parameters on their first use, so that importing this module reads and records nothing."""
+    if name == "parameters":
+        global parameters
+        parameters = setup_parameters()
+        return parameters
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["parameters"]
@@ -8,14 +8,16 @@ Generic exceptions that help delineate Test, Infra, or Product issues.
 """
 
 from collections import namedtuple
-import inspect
 import json
+import sys
+import types
 from typing import Any
 
-Blame = namedtuple("Blaming", "test, infra, product")("Test", "Infra", "Product")
-TestBakes = namedtuple("Reasons", "unexpected")(
-    "test called an infrastructure piece in a way that was unexpected, but predictable"
+Blame = types.SimpleNamespace(test="Test", infra="Infra", product="Product")
+TestBakes = types.SimpleNamespace(
+    unexpected="test called an infrastructure piece in a way that was unexpected, but predictable"
 )
+ReducedFrame = namedtuple("ReducedFrame", "file, method, line_number")
 
 
 class TestEnvironmentError(EnvironmentError):
@@ -67,6 +69,7 @@ class TestRestrictedOperationError(PermissionError):
                 suggested_next_steps=used_sns,
             )
         )
+        super().__init__(message)
 
 
 class TestTypeError(TypeError):
@@ -122,8 +125,10 @@ class TestValueError(ValueError):
 # - helper methods
 def get_caller():
     """Get the caller of the previous method call in the stack."""
-    reduced_frame = namedtuple("ReducedFrame", "file, method, line_number")
-    caller_frame = inspect.getouterframes(inspect.currentframe())[-2]
-    return reduced_frame(
-        *[getattr(caller_frame, attr) for attr in ["filename", "function", "lineno"]]
+    # - skip this frame and the exception's __init__ to land on what raised it
+    caller_frame = sys._getframe(2)
+    return ReducedFrame(
+        caller_frame.f_code.co_filename,
+        caller_frame.f_code.co_name,
+        caller_frame.f_lineno,
     )
@@ -8,7 +8,6 @@ SDK Processor that is dynamically judgy based upon the request and is self-aware
 """
 
 import asyncio
-import functools
 from pydantic import Field
 from starlette.requests import Request
 
@@ -48,89 +47,21 @@ class JudgyParameters(Parameters):
     # skip setting metadata on the response
     skip_metadata: bool = False
 
-    def __post_init__(self):
-        """Verify that each of the types are as expected.
-
-        Verifies, as a Parameters class could use built-in errors for Processor, the contents of the dataclass by
-        types as expected by definition.
-        """
-        if any(
-            (
-                illegal_types := {
-                    attr: getattr(self, attr)
-                    for attr in ["reject", "modified"]
-                    if not isinstance(getattr(self, attr), (bool, type(None)))
-                }
-            )
-        ):
-            raise TypeError(f"illegal non-boolean values in {illegal_types}")
-        if any(
-            (
-                illegal_types := {
-                    attr: getattr(self, attr)
-                    for attr in ["reject_reason", "modified_result"]
-                    if not isinstance(getattr(self, attr), (dict, type(None)))
-                }
-            )
-        ):
-            raise TypeError(f"illegal non-dict values in {illegal_types}")
-        if any(
-            (
-                illegal_types := {
-                    attr: getattr(self, attr)
-                    for attr in ["modified_reason"]
-                    if not isinstance(getattr(self, attr), (str, type(None)))
-                }
-            )
-        ):
-            raise TypeError(f"illegal non-str values in {illegal_types}")
-
 
 class JudgyRequiredParameters(JudgyParameters):
     required_message: str
 
 
-class JudgySync(Processor):
-    """Complete processor that behaves differently depending on JudgyParameters settings."""
+class Judging:
+    """Judgy's judging, shared by each of the ways Judgy implements a Processor.
 
-    @classmethod
-    def uses_process_method(cls):
-        return False
+    Kept apart from Processor so that each Judgy constructs only itself rather than also a JudgySync to delegate to.
+    """
 
     def __init__(self, *processor_args, **processor_kwargs):
-        """Allow for exceptions to be raised from Judgy during process()."""
+        """Allow for exceptions, possibly shared between tests, to be raised afresh from Judgy during process()."""
         self.raise_error = None
-        super().__init__(signature=BOTH_SIGNATURE, *processor_args, **processor_kwargs)
-
-    async def process_input(
-        self,
-        prompt: RequestInput,
-        metadata: Metadata,
-        parameters: JudgyParameters,
-        request: Request,
-    ) -> Result | Reject:
-        return self._internal_process(
-            prompt=prompt,
-            metadata=metadata,
-            parameters=parameters,
-            request=request,
-        )
-
-    async def process_response(
-        self,
-        prompt: RequestInput,
-        response: ResponseOutput,
-        metadata: Metadata,
-        parameters: JudgyParameters,
-        request: Request,
-    ) -> Result | Reject:
-        return self._internal_process(
-            prompt=prompt,
-            response=response,
-            metadata=metadata,
-            parameters=parameters,
-            request=request,
-        )
+        super().__init__(*processor_args, signature=BOTH_SIGNATURE, **processor_kwargs)
 
     def _internal_process(
         self,
@@ -142,7 +73,7 @@ class JudgySync(Processor):
     ) -> Result | Reject:
         """Respond dynamically based upon parameters given to the object initially by the test."""
         if isinstance((raise_error := self.raise_error), Exception):
-            raise raise_error
+            raise raise_error.with_traceback(None)
         if not isinstance((used_parameters := parameters), JudgyParameters):
             used_parameters = self.parameters
         if used_parameters.should_reject:
@@ -172,7 +103,45 @@ class JudgySync(Processor):
         return Result(**my_response)
 
 
-class JudgyAsync(Processor):
+class JudgySync(Judging, Processor):
+    """Complete processor that behaves differently depending on JudgyParameters settings."""
+
+    @classmethod
+    def uses_process_method(cls):
+        return False
+
+    async def process_input(
+        self,
+        prompt: RequestInput,
+        metadata: Metadata,
+        parameters: JudgyParameters,
+        request: Request,
+    ) -> Result | Reject:
+        return self._internal_process(
+            prompt=prompt,
+            metadata=metadata,
+            parameters=parameters,
+            request=request,
+        )
+
+    async def process_response(
+        self,
+        prompt: RequestInput,
+        response: ResponseOutput,
+        metadata: Metadata,
+        parameters: JudgyParameters,
+        request: Request,
+    ) -> Result | Reject:
+        return self._internal_process(
+            prompt=prompt,
+            response=response,
+            metadata=metadata,
+            parameters=parameters,
+            request=request,
+        )
+
+
+class JudgyAsync(Judging, Processor):
     """
     Implementation using async methods for process_input and process_response
     """
@@ -181,30 +150,18 @@ class JudgyAsync(Processor):
     def uses_process_method(cls):
         return False
 
-    def __init__(self, *processor_args, **processor_kwargs):
-        """Allow for exceptions to be raised from Judgy during process()."""
-        self.raise_error = None
-        self._internal_judgy = JudgySync(*processor_args, **processor_kwargs)
-        super().__init__(signature=BOTH_SIGNATURE, *processor_args, **processor_kwargs)
-
     async def process_input(self, **kwargs) -> Result | Reject:
-        if isinstance((raise_error := self.raise_error), Exception):
-            raise raise_error
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, functools.partial(self._internal_judgy._internal_process, **kwargs)
-        )
+        # - yield to the event loop as a truly async processor would, without a thread hop
+        await asyncio.sleep(0)
+        return self._internal_process(**kwargs)
 
     async def process_response(self, **kwargs) -> Result | Reject:
-        if isinstance((raise_error := self.raise_error), Exception):
-            raise raise_error
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, functools.partial(self._internal_judgy._internal_process, **kwargs)
-        )
+        # - yield to the event loop as a truly async processor would, without a thread hop
+        await asyncio.sleep(0)
+        return self._internal_process(**kwargs)
 
 
-class DeprecatedJudgy(Processor):
+class DeprecatedJudgy(Judging, Processor):
     """
     Implementation using the deprecated process method instead of process_input and process_response
     """
@@ -213,14 +170,6 @@ class DeprecatedJudgy(Processor):
     def uses_process_method(cls):
         return True
 
-    def __init__(self, *processor_args, **processor_kwargs):
-        """Allow for exceptions to be raised from Judgy during process()."""
-        self.raise_error = None
-        self._internal_judgy = JudgySync(*processor_args, **processor_kwargs)
-        super().__init__(signature=BOTH_SIGNATURE, *processor_args, **processor_kwargs)
-
     def process(self, **kwargs) -> Result | Reject:
         """Respond dynamically based upon parameters given to the object initially by the test."""
-        if isinstance((raise_error := self.raise_error), Exception):
-            raise raise_error
-        return self._internal_judgy._internal_process(**kwargs)
+        return self._internal_process(**kwargs)
@@ -7,6 +7,8 @@ LICENSE file in the root directory of this source tree.
 Basic hierarchy of libraries for testing involving filesystem objects.
 """
 
+import copy
+import functools
 import inspect
 import pathlib
 import types
@@ -15,14 +17,16 @@ import typing
 from .. import exceptions
 from . import decoders
 
+LIBRARY_DATA_DIR = pathlib.Path(__file__).parent.joinpath("data")
+
 
 def data_loader_factory(pytest_request: types.FunctionType):
     """Get a file contents loader as a factory that searches for where the given file exists.
 
     Gets a factory method that takes a file name and searches for it within 'data' directories found under this
-    module's directory or the pytest_request.function (test method being executed)'s directory.  If the file
-    cannot be found, then a general 'open' will be issued assuming that the given file name references a path to
-    the test data to load.
+    module's directory or the pytest_request.function (test method being executed)'s directory; module-scoped
+    fixtures search the pytest_request.module's directory instead.  If the file cannot be found, then a general
+    'open' will be issued assuming that the given file name references a path to the test data to load.
 
     Use:
         decoded = data_loader("feature.json")
@@ -35,21 +39,27 @@ def data_loader_factory(pytest_request: types.FunctionType):
             * (not recommended) is a fully-quantified file location (or relative location) on the filesystem
     """
 
-    if not (code_construct := getattr(pytest_request, "cls")):
+    if pytest_request.scope == "module":
+        # - neither cls nor function can be referenced in module-scoped fixtures
+        code_construct = pytest_request.module
+    elif not (code_construct := getattr(pytest_request, "cls")):
         code_construct = (
             pytest_request.function
         )  # cannot be referenced in class-scoped fixtures
     path_candidates = tuple(
         [
-            pathlib.Path(__file__).parent.joinpath("data"),
+            LIBRARY_DATA_DIR,
             pathlib.Path(inspect.getfile(code_construct)).parent.joinpath("data"),
             pathlib.Path().absolute().joinpath("data"),
         ]
     )
 
     def load_file(given_file: pathlib.Path):
-        """Load the file and decode its contents by extension."""
-        return decoders.decode_file(given_file)
+        """Load the file and decode its contents by extension; each caller gets its own copy to change."""
+        stat = (given_file := given_file.resolve()).stat()
+        return copy.deepcopy(
+            decode_file_once(given_file, stat.st_mtime_ns, stat.st_size)
+        )
 
     def loader_factory(file_name: typing.Union[str, pathlib.Path]):
         """Load the given file_name either in this or other data directory file locations."""
@@ -60,11 +70,8 @@ def data_loader_factory(pytest_request: types.FunctionType):
         candidate = pathlib.Path(
             candidate
         )  # if it is already a path, it will come back immediately
-        if candidate.is_file():
-            return load_file(candidate)
-        for location in path_candidates:
-            if (found := location.joinpath(candidate)).is_file():
-                return load_file(found)
+        if (found := find_data_file(path_candidates, candidate)) is not None:
+            return load_file(found)
         raise exceptions.TestEnvironmentError(
             message=f"{file_name} is not found in any of {path_candidates} locations and is not a file itself",
         )
@@ -72,6 +79,28 @@ def data_loader_factory(pytest_request: types.FunctionType):
     return loader_factory
 
 
+@functools.cache
+def find_data_file(
+    path_candidates: tuple[pathlib.Path, ...], candidate: pathlib.Path
+) -> typing.Optional[pathlib.Path]:
+    """Find, once per session, the given file itself or where it is within the candidate locations."""
+    if candidate.is_file():
+        return candidate
+    for location in path_candidates:
+        if (found := location.joinpath(candidate)).is_file():
+            return found
+    return None
+
+
+@functools.cache
+def decode_file_once(given_file: pathlib.Path, mtime_ns: int, size: int):
+    """Decode, once per version of the test data file, its contents; callers must not change what is returned.
+
+    The file's modification time and size are only part of the cache key, so that an edited file is decoded anew.
+    """
+    return decoders.decode_file(given_file)
+
+
 def get_working_dir(as_str: bool = False) -> typing.Union[str, pathlib.Path]:
     """Get the working directory as a pathlib.Path or as str if as_str is True."""
     working = pathlib.Path().absolute()
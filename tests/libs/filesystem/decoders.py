@@ -10,7 +10,6 @@ Simple decoder suite that offers helper methods to quickly decode text to interp
 import configparser
 from collections.abc import Callable
 from dataclasses import dataclass
-from io import StringIO
 import pathlib
 import json
 import typing
@@ -19,6 +18,9 @@ import yaml
 
 from .. import exceptions
 
+# - libyaml's C parser when PyYAML was built with it; test data needs no more than safe loading
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # - outside interfaces
 def decode_file(file_path) -> str:
@@ -36,11 +38,11 @@ def decode_config(
 ) -> configparser.ConfigParser:
     """Decode the given contents (or pointer to) for the given config."""
     check_for_something(text, source)
-    cached_input = source
-    if text:
-        cached_input = StringIO(text)
     parser = configparser.ConfigParser()
-    parser.read_file(iter(cached_input))
+    if text:
+        parser.read_string(text)
+    else:
+        parser.read_file(source)
     return parser
 
 
@@ -55,10 +57,7 @@ def decode_json(text: str = None, source: typing.TextIO = None) -> typing.Any:
 def decode_yaml(text: str = None, source: typing.TextIO = None) -> typing.Any:
     """Decode the given text or IO stream and decodes the contents."""
     check_for_something(text, source)
-    cached_input = source
-    if text:
-        cached_input = StringIO(text)
-    return yaml.load(cached_input, yaml.Loader)
+    return yaml.load(text if text else source, YamlLoader)
 
 
 def straight_text(text: str = None, source: typing.TextIO = None) -> typing.AnyStr:
@@ -100,18 +99,22 @@ class DecoderSuite:
     )
     yaml = Decoder(decode_yaml, "yaml", tuple([".yaml", ".yml"]))
 
+    # - each extension's decoder, tabled once rather than searched for on every file loaded
+    extension_decoders = {
+        extension: decoder
+        for decoder in (config, json, plain_text, yaml)
+        for extension in decoder.extensions
+    }
+
     @classmethod
     def by_extension(cls, filepath: pathlib.Path) -> Decoder:
         """Given the filepath, supply the suggested decoder."""
-        extension = filepath.suffix
-        if extension == ".j2" and len(filepath.suffixes) > 1:
-            extension = tuple(filepath.suffixes[-2:])
-        for attr in dir(cls):
-            decoder = getattr(cls, attr)
-            if not isinstance(decoder, Decoder):
-                continue
-            if extension in decoder.extensions:
-                return decoder
+        suffixes = filepath.suffixes  # - parsed from the name once for all checks below
+        extension = suffixes[-1] if suffixes else ""
+        if extension == ".j2" and len(suffixes) > 1:
+            extension = tuple(suffixes[-2:])
+        if (decoder := cls.extension_decoders.get(extension)) is not None:
+            return decoder
         raise exceptions.TestValueError(
             value=str(filepath),
             message=f"do not know how to decode {extension} type files",
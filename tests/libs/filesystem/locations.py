@@ -8,10 +8,12 @@ House helpers for formatting filenames out of the current test location & naming
 """
 
 import contextlib
+import functools
 import inspect
 import logging
 import pathlib
 import subprocess
+import sys
 import typing
 
 from .. import exceptions
@@ -20,7 +22,10 @@ from .. import config
 
 
 NON_WINDOWS_FRIENDLY = ["#", "<", ">", "%", ":", "/", "\\", '"', "|", "?", "*"]
+NON_WINDOWS_FRIENDLY_TABLE = str.maketrans(dict.fromkeys(NON_WINDOWS_FRIENDLY, "_"))
 LOGGER = logging.getLogger(__name__)
+# - log directories already made this session, so each is only created once
+CREATED_LOGDIRS: set[pathlib.Path] = set()
 
 
 class CurrentTest:
@@ -77,12 +82,14 @@ class CurrentTest:
         self.test_separator = self.default_test_separator
         self.from_request(request)
         self.logdir = pathlib.Path(config.parameters.log_dir).joinpath(logdir_child)
-        self.logdir.mkdir(parents=True, exist_ok=True)
+        if self.logdir not in CREATED_LOGDIRS:
+            self.logdir.mkdir(parents=True, exist_ok=True)
+            CREATED_LOGDIRS.add(self.logdir)
 
     def __call__(self, request=None):
         """Assign test attributes from an optional request pytest fixture, or stack."""
         self.from_request(request)
-        if request is None:
+        if request is None and (self.test_name is None or self.test_file is None):
             self.from_stack()
         return self
 
@@ -114,17 +121,16 @@ and 'test_file' attributes in a custom name""",
     @staticmethod
     def iter_segments(path, up_to="", include_extension=False):
         """Iterate through the path starting at the name through parents."""
-        name = path.stem
-        for remaining in path.suffixes[:-1]:
-            # removes all remaining extensions
-            name = name.replace(remaining, "")
-        if include_extension:
-            name = path.name
-        parent = path.parent
+        name = path.name
+        if not include_extension:
+            # removes all extensions, parsing them from the name only once
+            name = name[: len(name) - len("".join(path.suffixes))]
         yield name
-        while parent.name != up_to and parent.name != "":
-            yield parent.name
-            parent = parent.parent
+        # - walk the already parsed parts rather than building each parent path
+        for parent_name in reversed(path.parts[:-1]):
+            if parent_name in (up_to, path.anchor):
+                break
+            yield parent_name
 
     def add_parent(
         self,
@@ -178,9 +184,7 @@ and 'test_file' attributes in a custom name""",
         root_dirname = repo_root.name
         segments = list(self.iter_segments(file_path, up_to=root_dirname))
         segments.reverse()
-        return self.file_segment_separator.join(
-            (path_segment for path_segment in segments)
-        )
+        return self.file_segment_separator.join(segments)
 
     def file_name_format(self, suffix=None, prefix=None):
         """Get the file format of the test's file and name."""
@@ -195,9 +199,7 @@ and 'test_file' attributes in a custom name""",
         formatted = f"{path_str}{self.test_separator}{name}"
         if isinstance(prefix, str) and isinstance(suffix, str):
             formatted = prefix + formatted + suffix
-        for char in NON_WINDOWS_FRIENDLY:
-            formatted = formatted.replace(char, "_")
-        return formatted
+        return formatted.translate(NON_WINDOWS_FRIENDLY_TABLE)
 
     def from_request(self, request):
         """Assign values from the given pytest.fixture request."""
@@ -216,30 +218,31 @@ and 'test_file' attributes in a custom name""",
         that is noted as the value used.
         """
         previous_frame = None
-        outer_frames = inspect.getouterframes(inspect.currentframe())
-        for cnt, frame in enumerate(outer_frames):
-            if "main" in frame.function:
-                self.test_name = frame.function
-                self.test_file = frame.filename
+        # - walk the frames themselves; FrameInfo records would read each frame's source context
+        frame = sys._getframe()
+        while frame is not None:
+            function = frame.f_code.co_name
+            if "main" in function:
+                self._from_frame(frame)
                 break
-            if frame.function == "pytest_pyfunc_call":
-                self.test_name = outer_frames[cnt - 1].function
-                self.test_file = outer_frames[cnt - 1].filename
+            if function == "pytest_pyfunc_call":
+                self._from_frame(previous_frame)
                 break
-            if frame.function.startswith("test_") and "test_" in frame.filename:
-                self.test_name = frame.function
-                self.test_file = frame.filename
+            if function.startswith("test_") and "test_" in frame.f_code.co_filename:
+                self._from_frame(frame)
                 break
-            if frame.function.startswith("call_fixture") or frame.function.endswith(
-                "_fixture"
-            ):
-                self.test_name = previous_frame.function
-                self.test_file = previous_frame.filename
+            if function.startswith("call_fixture") or function.endswith("_fixture"):
+                self._from_frame(previous_frame)
                 break
             previous_frame = frame
+            frame = frame.f_back
         else:
-            self.test_name = outer_frames[-1].function
-            self.test_file = outer_frames[-1].filename
+            self._from_frame(previous_frame)
+
+    def _from_frame(self, frame):
+        """Assign values from the given stack frame's code."""
+        self.test_name = frame.f_code.co_name
+        self.test_file = frame.f_code.co_filename
 
     def get_xray_format(self):
         """Get Jira XRAY format of the test location."""
@@ -264,12 +267,14 @@ def get_root_dir(
     source: typing.Optional[typing.Union[str, pathlib.Path]] = None,
 ) -> pathlib.Path:
     """Get the root directory of the repository from the source or '.'."""
-    if (used_source := source) is not None:
-        used_source = pathlib.Path()
-    else:
-        used_source = "."
-    used_source = pathlib.Path(used_source)
+    used_source = source if source is not None else "."
+    return git_toplevel(pathlib.Path(used_source).resolve())
+
+
+@functools.cache
+def git_toplevel(source: pathlib.Path) -> pathlib.Path:
+    """Get, asking git once per resolved source directory, the root directory of its repository."""
     root_path = subprocess.check_output(
-        f"cd {used_source}; git rev-parse --show-toplevel", shell=True
+        ["git", "rev-parse", "--show-toplevel"], cwd=source
     )
     return pathlib.Path(root_path.strip().decode())
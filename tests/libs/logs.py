@@ -102,6 +102,25 @@ class Log:
         return {attr: getattr(self, attr) for attr in self.__match_args__}
 
 
+# - every test's file log shares the one, unvarying, JSON log entry format
+LOG_FORMATTER = logging.Formatter(
+    json.dumps(
+        Log(
+            metadata=LogMetadata(
+                time="%(asctime)s",
+                log_level="%(levelname)s",
+                location=LogLocation(
+                    file="%(filename)s",
+                    function="%(funcName)s",
+                    line="%(lineno)d",
+                ).as_dict(),
+            ).as_dict(),
+            log="%(message)s",
+        ).as_dict()
+    )
+)
+
+
 @pytest.fixture
 def logging_fx(request: pytest.FixtureRequest):
     """Communicate and handle testing logging."""
@@ -113,27 +132,14 @@ def logging_fx(request: pytest.FixtureRequest):
     term_level = getattr(logging, term_level.upper(), DEFAULT_TERMINAL_LOGGING_LEVEL)
     logger = logging.getLogger()
     set_other_handlers(logger, term_level, debug)
-    encoded_format = Log(
-        metadata=LogMetadata(
-            time="%(asctime)s",
-            log_level="%(levelname)s",
-            location=LogLocation(
-                file="%(filename)s",
-                function="%(funcName)s",
-                line="%(lineno)d",
-            ).as_dict(),
-        ).as_dict(),
-        log="%(message)s",
-    ).as_dict()
-    log_format = logging.Formatter(json.dumps(encoded_format))
     test_location = locations.CurrentTest(request=request, logdir_child="logs")
-    file_handler = set_file_handler(logger, request, log_format, test_location)
+    file_handler = set_file_handler(logger, request, LOG_FORMATTER, test_location)
     start = datetime.datetime.now(datetime.timezone.utc)
     try:
         yield logger
     finally:
         logger.info(
-            f"test duration: {datetime.datetime.now(datetime.timezone.utc) - start}"
+            "test duration: %s", datetime.datetime.now(datetime.timezone.utc) - start
         )
         if (exc := get_last_exception()) is not None:
             logger.error("".join(traceback.format_exception(*exc)))
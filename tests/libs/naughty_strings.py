@@ -5,7 +5,8 @@ This source code is licensed under the Apache License Version 2.0 found in the
 LICENSE file in the root directory of this source tree.
 """
 
-import base64
+import binascii
+import functools
 import os.path
 from collections.abc import Iterable
 
@@ -21,36 +22,47 @@ class NaughtyStrings(Iterable[str]):
     )
 
     def __init__(self, path: str | None = None):
-        if path is None:
-            self.path = NaughtyStrings.default_path
+        self.path = path if path is not None else NaughtyStrings.default_path
 
     def __iter__(self):
-        # The first comment line in a section of comments describes the category of strings. We use this flag
-        # to identify if we are on the first comment line.
-        top_comment_line = True
-        line_no = 0
-
-        with open(self.path) as f:
-            for line in f:
-                line_no += 1
-
-                if line.startswith("#"):
-                    if top_comment_line:
-                        self.section = line[1:].strip()
-                        top_comment_line = False
-                else:
-                    top_comment_line = True
-                    try:
-                        b64decoded = base64.b64decode(line)
-                    except Exception as e:
-                        msg = f"Error mime64 decoding line {line_no} in section {self.section}: {line}"
-                        raise NaughtStringParseException(msg) from e
-                    try:
-                        decoded = b64decoded.decode("utf-8")
-                    except UnicodeDecodeError:
-                        continue
-                    except Exception as e:
-                        msg = f"Error charset decoding line {line_no} in section {self.section}: {b64decoded}"
-                        raise NaughtStringParseException(msg) from e
-
-                    yield decoded
+        return iter(load_naughty_strings(self.path))
+
+
+@functools.cache
+def load_naughty_strings(path: str) -> tuple[str, ...]:
+    """Load, decoding once per path, the naughty strings from the base64 encoded file."""
+    return tuple(iter_naughty_strings(path))
+
+
+def iter_naughty_strings(path: str):
+    """Iterate over the decoded naughty strings in the base64 encoded file."""
+    # The first comment line in a section of comments describes the category of strings. We use this flag
+    # to identify if we are on the first comment line.
+    top_comment_line = True
+    line_no = 0
+    section = None
+
+    with open(path, "rb") as f:
+        for line in f:
+            line_no += 1
+
+            if line.startswith(b"#"):
+                if top_comment_line:
+                    section = line[1:].strip().decode("utf-8")
+                    top_comment_line = False
+            else:
+                top_comment_line = True
+                try:
+                    b64decoded = binascii.a2b_base64(line)
+                except Exception as e:
+                    msg = f"Error mime64 decoding line {line_no} in section {section}: {line}"
+                    raise NaughtStringParseException(msg) from e
+                try:
+                    decoded = b64decoded.decode("utf-8")
+                except UnicodeDecodeError:
+                    continue
+                except Exception as e:
+                    msg = f"Error charset decoding line {line_no} in section {section}: {b64decoded}"
+                    raise NaughtStringParseException(msg) from e
+
+                yield decoded
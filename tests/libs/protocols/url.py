@@ -7,6 +7,7 @@ LICENSE file in the root directory of this source tree.
 House general URL tools useful for manipulating urllib3.util.Url objects.
 """
 
+import functools
 import pathlib
 import urllib
 
@@ -58,7 +59,9 @@ def join_url(base, *uri, preserve_base=True, scheme=False):
 
     The 'preserve_base' option is a requirement to match CurlRequst.join_url.
     """
-    url = urllib3.util.url.parse_url(base)
+    url = base
+    if not isinstance(url, urllib3.util.url.Url):
+        url = parse_url(url)
     if isinstance(url.path, (bytes, str)):
         path = pathlib.PosixPath(url.path)
     else:
@@ -78,12 +81,15 @@ def join_url(base, *uri, preserve_base=True, scheme=False):
     return str(path)
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_url(str_url):
     """Get the parsed URL object.
 
     Gets a ``urllib3.util.Url`` object in a uniform way such that if an unpredictable
     security issue around parsing URL's is discovered against ``urllib3``, it's utils, etc.
     then the pain of updating is minimal.  Also looking at the in-progress ``urllib4``.
+
+    As ``Url`` objects are immutable, each distinct URL string is parsed only once.
     """
     return urllib3.util.parse_url(str_url)
 
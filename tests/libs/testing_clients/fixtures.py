@@ -7,6 +7,8 @@ LICENSE file in the root directory of this source tree.
 Offers a means to stand up starlette testclient's without having to import or handle anything in tests.
 """
 
+import contextlib
+
 import pytest
 from starlette.applications import Starlette
 from starlette import testclient
@@ -16,11 +18,19 @@ from f5_ai_gateway_sdk.processor_routes import ProcessorRoutes
 from tests.libs import exceptions
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def processor_client_loader():
-    """Loader factory for loading any processor that fulfills the python-starlet-processor SDK."""
+    """Loader factory for loading any processor that fulfills the python-starlet-processor SDK.
+
+    Clients are memoized per processor instance and entered once, so that the app and its portal are stood up a
+    single time however many of a module's tests share that processor; all are closed as the module ends.
+    One-off processors pass ``memoize=False`` to get a plain client that is neither entered nor kept.
+    """
+    clients: dict[int, tuple[Processor, testclient.TestClient]] = {}
 
-    def get_testclient(processor: Processor) -> testclient.TestClient:
+    def get_testclient(
+        processor: Processor, memoize: bool = True
+    ) -> testclient.TestClient:
         """Generate a TestClient based upon the provided Processor."""
         # - verify given
         if not isinstance(processor, (expected := Processor)):
@@ -28,17 +38,30 @@ def processor_client_loader():
                 f"expected {expected} type not {type(processor)}"
             )
 
+        # - reuse the client for a processor already stood up; the processor is held so its id stays unique
+        if (known := clients.get(id(processor))) is not None:
+            return known[1]
+
         # - generate and return client
         constructed_app = Starlette(debug=True, routes=processor.routes)
-        client = testclient.TestClient(app=constructed_app)
+        if not memoize:
+            return testclient.TestClient(app=constructed_app)
+        client = stack.enter_context(testclient.TestClient(app=constructed_app))
+        clients[id(processor)] = (processor, client)
         return client
 
-    return get_testclient
+    with contextlib.ExitStack() as stack:
+        yield get_testclient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processor_routes_client_loader():
-    """Loader for creating a ProcessorRoutes object."""
+    """Loader for creating a ProcessorRoutes object.
+
+    Clients are memoized per ProcessorRoutes instance, so that the app is stood up a single time however many tests
+    share those routes.
+    """
+    clients: dict[int, tuple[ProcessorRoutes, testclient.TestClient]] = {}
 
     def get_testclient(routes: ProcessorRoutes) -> testclient.TestClient:
         """Generate and return, as a factory, starlette test clients from provided ProcessorRoutes."""
@@ -48,8 +71,14 @@ def processor_routes_client_loader():
                 f"expected {expected} type not {type(routes)}"
             )
 
+        # - reuse the client for routes already stood up; the routes are held so their id stays unique
+        if (known := clients.get(id(routes))) is not None:
+            return known[1]
+
         # - generate and return client
         constructed_app = Starlette(debug=True, routes=routes)
-        return testclient.TestClient(constructed_app)
+        client = testclient.TestClient(constructed_app)
+        clients[id(routes)] = (routes, client)
+        return client
 
     return get_testclient
@@ -5,6 +5,8 @@ This source code is licensed under the Apache License Version 2.0 found in the
 LICENSE file in the root directory of this source tree.
 """
 
+import codecs
+import functools
 import json
 from collections.abc import Iterable
 
@@ -29,11 +31,15 @@ from f5_ai_gateway_sdk.type_hints import JSON
 class FieldValue:
     def __init__(self, part: BodyPart):
         self.encoding = part.encoding if part.encoding else DEFAULT_ENCODING
-        self.content = part.content.decode(self.encoding)
+        self.raw_content = part.content
         self.headers = CaseInsensitiveDict()
         for key, value in part.headers.items():
             self.headers[key.decode(HEADER_ENCODING)] = value.decode(HEADER_ENCODING)
 
+    @functools.cached_property
+    def content(self) -> str:
+        return self.raw_content.decode(self.encoding)
+
     def get_required_header(self, header_name: str) -> str:
         header = self.headers.get(header_name)
         if not header:
@@ -47,6 +53,9 @@ class FieldValue:
         return self.get_required_header("Content-Type")
 
     def as_json(self) -> JSON:
+        if codecs.lookup(self.encoding).name == "utf-8":
+            # - json reads UTF-8 bytes itself, sparing the decoded copy of the content
+            return json.loads(self.raw_content)
         return json.loads(self.content)
 
 
@@ -60,13 +69,13 @@ class MultipartDecoderHelper:
 
     def add_parts_by_name(self, parts: Iterable[BodyPart]):
         for part in parts:
-            content_disposition = part.headers[b"Content-Disposition"]
+            # - the field decodes its headers once; parse the name from that rather than the raw bytes
+            field = FieldValue(part)
+            content_disposition = field.headers.get("Content-Disposition")
             if not content_disposition:
                 raise ValueError("Content-Disposition header is required")
             message = Message()
-            message.add_header(
-                "Content-Disposition", content_disposition.decode(HEADER_ENCODING)
-            )
+            message.add_header("Content-Disposition", content_disposition)
             name = message.get_param(
                 param="name", unquote=True, header="Content-Disposition"
             )
@@ -74,7 +83,7 @@ class MultipartDecoderHelper:
                 raise ValueError(
                     "Content-Disposition header must have a name parameter"
                 )
-            self.__fields[name] = FieldValue(part)
+            self.__fields[name] = field
             self.__field_order.append(name)
 
     @property
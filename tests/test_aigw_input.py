@@ -13,13 +13,19 @@ import pytest
 
 
 CONTENT_STRING = "Everybody loves cats because cats are cute and cuddly. But what if cats were lions? What would the world be like if cats were lions?"
+CUSTOM_ROLE = "friend"
+INPUT_JSON = json.dumps({"messages": [{"content": CONTENT_STRING}]})
+SYSTEM_ROLE_INPUT_JSON = json.dumps(
+    {"messages": [{"content": CONTENT_STRING, "role": "system"}]}
+)
+CUSTOM_ROLE_INPUT_JSON = json.dumps(
+    {"messages": [{"content": CONTENT_STRING, "role": CUSTOM_ROLE}]}
+)
 
 
 def test_json_object_hook_parses():
     """Test that RequestInput.model_validate_json correctly parses valid JSON input."""
-    input_json = json.dumps({"messages": [{"content": CONTENT_STRING}]})
-
-    parsed_input = RequestInput.model_validate_json(input_json)
+    parsed_input = RequestInput.model_validate_json(INPUT_JSON)
 
     assert isinstance(parsed_input, RequestInput)
     assert len(parsed_input.messages) == 1
@@ -29,18 +35,7 @@ def test_json_object_hook_parses():
 
 def test_json_object_hook_allows_role():
     """Test that RequestInput.model_validate_json correctly handles input with a specific role."""
-    input_json = json.dumps(
-        {
-            "messages": [
-                {
-                    "content": CONTENT_STRING,
-                    "role": "system",
-                }
-            ]
-        }
-    )
-
-    parsed_input = RequestInput.model_validate_json(input_json)
+    parsed_input = RequestInput.model_validate_json(SYSTEM_ROLE_INPUT_JSON)
 
     assert isinstance(parsed_input, RequestInput)
     assert len(parsed_input.messages) == 1
@@ -50,19 +45,7 @@ def test_json_object_hook_allows_role():
 
 def test_json_object_hook_allows_arbitrary_role():
     """Test that RequestInput.model_validate_json accepts arbitrary role values."""
-    CUSTOM_ROLE = "friend"
-    input_json = json.dumps(
-        {
-            "messages": [
-                {
-                    "content": CONTENT_STRING,
-                    "role": CUSTOM_ROLE,
-                }
-            ]
-        }
-    )
-
-    parsed_input = RequestInput.model_validate_json(input_json)
+    parsed_input = RequestInput.model_validate_json(CUSTOM_ROLE_INPUT_JSON)
 
     assert isinstance(parsed_input, RequestInput)
     assert len(parsed_input.messages) == 1
@@ -72,7 +55,5 @@ def test_json_object_hook_allows_arbitrary_role():
 
 def test_json_object_invalid():
     """Test that RequestInput.model_validate_json raises a ValidationError for invalid JSON."""
-    input_json = json.dumps({"messages": [{"content": CONTENT_STRING}]})[1:]
-
     with pytest.raises(ValidationError):
-        RequestInput.model_validate_json(input_json)
+        RequestInput.model_validate_json(INPUT_JSON[1:])
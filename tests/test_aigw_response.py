@@ -12,24 +12,14 @@ import json
 
 
 CONTENT_STRING = "Everybody loves cats because cats are cute and cuddly. But what if cats were lions? What would the world be like if cats were lions?"
+RESPONSE_JSON = json.dumps(
+    {"choices": [{"message": {"content": CONTENT_STRING, "role": "assistant"}}]}
+)
 
 
 def test_json_object_hook_parses():
     """Test that ResponseOutput.model_validate_json correctly parses valid JSON response."""
-    response_json = json.dumps(
-        {
-            "choices": [
-                {
-                    "message": {
-                        "content": CONTENT_STRING,
-                        "role": "assistant",
-                    }
-                }
-            ]
-        }
-    )
-
-    parsed_response = ResponseOutput.model_validate_json(response_json)
+    parsed_response = ResponseOutput.model_validate_json(RESPONSE_JSON)
 
     assert isinstance(parsed_response, ResponseOutput)
     assert len(parsed_response.choices) == 1
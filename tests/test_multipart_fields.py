@@ -19,21 +19,23 @@ from f5_ai_gateway_sdk.multipart_fields import (
     generate_boundary,
 )
 
+NAUGHTY_STRINGS = tuple(NaughtyStrings())
+NAUGHTY_STRINGS_JOINED = "\n".join(NAUGHTY_STRINGS)
+
 
 class MultipartIO(BytesIO):
     def __init__(self, boundary: str):
         super().__init__()
         self.boundary = boundary
         self.content_type = f'multipart/form-data;boundary="{self.boundary}"'
+        self.closing_boundary = f"--{self.boundary}--\r\n".encode(HEADER_ENCODING)
 
     def write_iterable(self, iterable: Iterable[bytes]) -> None:
-        for chunk in iterable:
-            self.write(chunk)
-
+        self.writelines(iterable)
         self.write_closing_boundary()
 
     def write_closing_boundary(self) -> None:
-        self.write(f"--{self.boundary}--\r\n".encode(HEADER_ENCODING))
+        self.write(self.closing_boundary)
         self.flush()
 
 
@@ -78,7 +80,7 @@ def assertMultipartDecodes(
         )
         actual = decoder.parts[0].text
 
-        expected = "".join(content) if isinstance(content, Iterable) else content
+        expected = content if isinstance(content, str) else "".join(content)
         assert expected == actual, "multipart decode content match"
 
 
@@ -97,14 +99,14 @@ def test_encode_multipart_boundary_unicode():
 
 
 def test_encode_multipart_field_str():
-    content = "\n".join(NaughtyStrings())
+    content = NAUGHTY_STRINGS_JOINED
     boundary = "boundary"
     multipart = encode_multipart_field(boundary, default_test_headers, content)
     assertMultipartDecodes(boundary, multipart, content)
 
 
 def test_encode_multipart_field_iter():
-    content = NaughtyStrings()
+    content = NAUGHTY_STRINGS
     boundary = "boundary"
     multipart = encode_multipart_field(boundary, default_test_headers, content)
     assertMultipartDecodes(boundary, multipart, content)
@@ -65,10 +65,7 @@ def test_can_read_otel_attributes():
         "parameters.one_string_dict.key": "value",
         "parameters.one_string_nested_dict.key1.key2": "value",
     }
-    for k, v in expected.items():
-        assert k in attributes
-        assert attributes[k] == v, f"{attributes[k]} != {v}"
-    assert expected == attributes
+    assert expected == attributes, "otel params match"
 
 
 def test_unsupported_otel_attributes():
@@ -5,16 +5,15 @@ This source code is licensed under the Apache License Version 2.0 found in the
 LICENSE file in the root directory of this source tree.
 """
 
+import functools
 import json
-import unittest
-from io import BytesIO
+import logging
 from typing import Any
 from collections.abc import Iterable, Mapping
 
 import pytest
 from parameterized import parameterized
-from requests_toolbelt import MultipartEncoder
-from starlette.datastructures import FormData, Headers
+from starlette.datastructures import FormData
 from starlette.requests import Request
 from starlette.responses import (
     Response as HttpResponse,
@@ -65,36 +64,47 @@ FAKE_NAME = "test"
 FAKE_VERSION = "1"
 FAKE_NAMESPACE = "testing"
 APP_DETAILS = {"version": "1.0.0"}
+MULTIPART_BOUNDARY = "boundary"
 TEST_MESSAGE = Message(content="Are cats better than dogs?")
 TEST_REQ_INPUT = RequestInput(messages=[TEST_MESSAGE])
+TEST_REQ_INPUT_JSON = TEST_REQ_INPUT.model_dump_json()
+
+
+class FakeProcessor(Processor):
+    def __init__(
+        self,
+        name: str,
+        namespace: str,
+        version: str,
+        signature: Signature,
+        result: Result | Reject | None,
+    ):
+        super().__init__(
+            prompt_class=RequestInput,
+            response_class=ResponseOutput,
+            name=name,
+            namespace=namespace,
+            version=version,
+            signature=signature,
+            app_details=APP_DETAILS,
+        )
+        self.fake_result = result
+
+    def process(
+        self,
+        prompt: RequestInput,
+        response: ResponseOutput,
+        metadata: Metadata,
+        parameters: DefaultParameters,
+        request: Request,
+    ) -> Result | Reject:
+        return self.fake_result or Result()
 
 
 def fake_processor(
     result: Result | Reject | None = None, a_signature: Signature = BOTH_SIGNATURE
 ) -> Processor:
-    class FakeProcessor(Processor):
-        def __init__(self, name: str, namespace: str, version: str):
-            super().__init__(
-                prompt_class=RequestInput,
-                response_class=ResponseOutput,
-                name=name,
-                namespace=namespace,
-                version=version,
-                signature=a_signature,
-                app_details=APP_DETAILS,
-            )
-
-        def process(
-            self,
-            prompt: RequestInput,
-            response: ResponseOutput,
-            metadata: Metadata,
-            parameters: DefaultParameters,
-            request: Request,
-        ) -> Result | Reject:
-            return result or Result()
-
-    return FakeProcessor(FAKE_NAME, FAKE_NAMESPACE, FAKE_VERSION)
+    return FakeProcessor(FAKE_NAME, FAKE_NAMESPACE, FAKE_VERSION, a_signature, result)
 
 
 class MinimalFakeProcessor(Processor):
@@ -102,6 +112,75 @@ class MinimalFakeProcessor(Processor):
         return Result()
 
 
+class AsyncImplementedProcessor(Processor):
+    def __init__(self):
+        super().__init__(
+            name="non-implemented-processor",
+            namespace="fake",
+            signature=BOTH_SIGNATURE,
+            version="v1",
+        )
+
+    async def process_input(self):
+        return Result()
+
+    async def process_response(self):
+        return Result()
+
+
+class AsyncInputProcessor(Processor):
+    def __init__(self):
+        super().__init__(
+            name="async-input-processor",
+            namespace="fake",
+            signature=INPUT_ONLY_SIGNATURE,
+            version="v1",
+        )
+
+    async def process_input(self, prompt, metadata, parameters, request) -> Result:
+        prompt.messages.append(Message(content="Test message"))
+        return Result(modified_prompt=prompt)
+
+
+class InputMatchProcessor(Processor):
+    def __init__(self):
+        super().__init__(
+            name="non-implemented-processor",
+            namespace="fake",
+            signature=INPUT_ONLY_SIGNATURE,
+            version="v1",
+        )
+
+    def process_input(self):
+        return Result()
+
+
+class ResponseMatchProcessor(Processor):
+    def __init__(self):
+        super().__init__(
+            name="non-implemented-processor",
+            namespace="fake",
+            signature=RESPONSE_ONLY_SIGNATURE,
+            version="v1",
+        )
+
+    def process_response(self):
+        return Result()
+
+
+class DeprecatedProcessor(Processor):
+    def __init__(self):
+        super().__init__(
+            name="non-implemented-processor",
+            namespace="fake",
+            signature=BOTH_SIGNATURE,
+            version="v1",
+        )
+
+    def process(self):
+        return Result()
+
+
 def fake_request(
     method: str,
     headers: Mapping[str, str] | None = None,
@@ -112,14 +191,16 @@ def fake_request(
         "path": f"/execute/{FAKE_NAMESPACE}/{FAKE_NAME.lower()}",
         "method": method,
         "path_params": {"command": "execute"},
+        "headers": [
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in (headers or {}).items()
+        ],
     }
     if receive is None:
         request = Request(scope=scope)
     else:
         request = Request(scope=scope, receive=receive)
 
-    request._headers = Headers(headers)
-
     return request
 
 
@@ -129,48 +210,119 @@ def fake_multipart_request(
     metadata: Metadata | None = None,
     parameters: Mapping[str, Any] | None = None,
     with_filenames: bool = False,
+    chunk_size: int | None = None,
 ) -> Request:
-    boundary = "boundary"
-    encoding = "utf-8"
-
-    fields = {}
-    if metadata:
-        metadata_json = json.dumps(metadata)
-        filename = "metadata.json" if with_filenames else None
-        fields[METADATA_NAME] = (filename, metadata_json, "application/json")
-    if prompt:
-        filename = "prompt.txt" if with_filenames else None
-        fields[INPUT_NAME] = (filename, prompt, f"text/plain;charset={encoding}")
-    if response:
-        filename = "response.txt" if with_filenames else None
-        fields[RESPONSE_NAME] = (filename, response, f"text/plain;charset={encoding}")
-    if parameters:
-        parameters_json = json.dumps(parameters)
-        filename = "parameters.json" if with_filenames else None
-        fields[INPUT_PARAMETERS_NAME] = (filename, parameters_json, "application/json")
-
-    multipart_data = MultipartEncoder(
-        fields=fields, encoding=encoding, boundary=boundary
+    body = encode_multipart_body(
+        prompt,
+        response,
+        json.dumps(metadata) if metadata else None,
+        json.dumps(parameters) if parameters else None,
+        with_filenames,
     )
 
-    async def receive():
-        return {"type": "http.request", "body": multipart_data.to_string()}
+    if chunk_size is None:
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+    else:
+        chunks = iter(range(0, len(body), chunk_size))
+
+        async def receive():
+            # - send the body in chunk_size slices, flagging all but the last as more_body
+            start = next(chunks, len(body))
+            end = start + chunk_size
+            return {
+                "type": "http.request",
+                "body": body[start:end],
+                "more_body": end < len(body),
+            }
 
     return fake_request(
         method="POST",
-        headers={"content-type": f"multipart/form-data;boundary={boundary}"},
+        headers={"content-type": f"multipart/form-data;boundary={MULTIPART_BOUNDARY}"},
         receive=receive,
     )
 
 
+@functools.lru_cache(maxsize=256)
+def encode_multipart_body(
+    prompt: str | None,
+    response: str | None,
+    metadata_json: str | None,
+    parameters_json: str | None,
+    with_filenames: bool,
+) -> bytes:
+    """Encode, once per distinct set of fields, the multipart body of a fake request."""
+    encoding = "utf-8"
+    fields = (
+        (METADATA_NAME, "metadata.json", metadata_json, "application/json"),
+        (INPUT_NAME, "prompt.txt", prompt, f"text/plain;charset={encoding}"),
+        (RESPONSE_NAME, "response.txt", response, f"text/plain;charset={encoding}"),
+        (
+            INPUT_PARAMETERS_NAME,
+            "parameters.json",
+            parameters_json,
+            "application/json",
+        ),
+    )
+
+    body = bytearray()
+    for name, filename, content, content_type in fields:
+        if not content:
+            continue
+        disposition = f'form-data; name="{name}"'
+        if with_filenames:
+            disposition += f'; filename="{filename}"'
+        body.extend(
+            f"--{MULTIPART_BOUNDARY}\r\n"
+            f"Content-Disposition: {disposition}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n".encode(encoding)
+        )
+        body.extend(content.encode(encoding))
+        body.extend(b"\r\n")
+    body.extend(f"--{MULTIPART_BOUNDARY}--\r\n".encode(encoding))
+
+    return bytes(body)
+
+
 FAKE_TAGS = Tags({"test1": ["a", "b"]})
 
 
+async def buffer_response(response: HttpResponse) -> bytes:
+    """Buffer the whole body of a multipart response."""
+    assert isinstance(response, MultipartResponse)
+    multipart_response: MultipartResponse = response
+
+    return b"".join([chunk async for chunk in multipart_response.body_iterator])
+
+
+def assert_status_code_equal(response: HttpResponse, status_code: int):
+    """Assert the response status code, showing the server response on a mismatch."""
+    if not response:
+        pytest.fail("Response is None")
+
+    assert isinstance(response, HttpResponse), (
+        f"Expected HttpResponse, got {type(response)}"
+    )
+
+    if response.status_code != status_code:
+        if not hasattr(response, "body") or isinstance(
+            response.body, HttpStreamingResponse
+        ):
+            pytest.fail(
+                f"Expected status code {status_code}, got {response.status_code}"
+            )
+        else:
+            pytest.fail(
+                f"Expected status code {status_code}, got {response.status_code}. "
+                f"Server response: \n{response.body}"
+            )
+
+
 # noinspection PyTestUnpassedFixture
 @pytest.mark.usefixtures("class_data_loader")
-class ProcessorTest(unittest.IsolatedAsyncioTestCase):
-    maxDiff = None
-
+class TestProcessor:
     async def test_handle_head_request(self):
         """Test that HEAD requests to the processor return a 200 OK status code."""
         request = fake_request("HEAD")
@@ -178,29 +330,32 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-    async def test_handle_unsupported_method(self):
-        """Test that unsupported HTTP methods return a 405 Method Not Allowed status code."""
-        unsupported_methods = [
-            "GET",
-            "PUT",
-            "DELETE",
-            "PATCH",
-            "OPTIONS",
-            "TRACE",
-            "CONNECT",
-            "UNKNOWN",
+    @parameterized.expand(
+        [
+            ("GET",),
+            ("PUT",),
+            ("DELETE",),
+            ("PATCH",),
+            ("OPTIONS",),
+            ("TRACE",),
+            ("CONNECT",),
+            ("UNKNOWN",),
         ]
+    )
+    async def test_handle_unsupported_method(self, method: str):
+        """Test that unsupported HTTP methods return a 405 Method Not Allowed status code."""
         processor = fake_processor()
-        for method in unsupported_methods:
-            request = fake_request(method)
+        request = fake_request(method)
 
-            response = await processor.handle_request(request)
+        response = await processor.handle_request(request)
 
-            self.assertStatusCodeEqual(response, HTTP_405_METHOD_NOT_ALLOWED)
-            body = json.loads(response.body)
-            self.assertEqual("Only POST requests are supported", body.get("message"))
+        assert_status_code_equal(response, HTTP_405_METHOD_NOT_ALLOWED)
+        assert (
+            b'{"message": "Only POST requests are supported", "status_code": 405}'
+            == response.body
+        )
 
     async def test_no_headers_set(self):
         """Test that requests with no headers set return a 400 Bad Request status code."""
@@ -209,8 +364,8 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
-        self.assertEqual(response.body, b'{"detail": "Content-Type header missing"}')
+        assert_status_code_equal(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        assert response.body == b'{"detail": "Content-Type header missing"}'
 
     async def test_empty_content_type(self):
         """Test that requests with an empty Content-Type header return a 400 Bad Request status code."""
@@ -219,8 +374,8 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
-        self.assertEqual(b'{"detail": "Content-Type header is empty"}', response.body)
+        assert_status_code_equal(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        assert b'{"detail": "Content-Type header is empty"}' == response.body
 
     async def test_incorrect_content_type(self):
         """Test that requests with an incorrect Content-Type header return a 400 Bad Request status code."""
@@ -231,10 +386,10 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
-        self.assertEqual(
-            b'{"detail": "Content-Type header mismatch - expecting: multipart/form-data"}',
-            response.body,
+        assert_status_code_equal(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        assert (
+            b'{"detail": "Content-Type header mismatch - expecting: multipart/form-data"}'
+            == response.body
         )
 
     async def test_content_type_with_no_boundary(self):
@@ -246,10 +401,8 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
-        self.assertEqual(
-            b'{"detail": "Content-Type header missing boundary"}', response.body
-        )
+        assert_status_code_equal(response, HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        assert b'{"detail": "Content-Type header missing boundary"}' == response.body
 
     async def test_handle_missing_parameters_metadata_and_body(self):
         """Test that requests missing required multipart fields return a 400 Bad Request status code."""
@@ -266,8 +419,8 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_400_BAD_REQUEST)
-        self.assertEqual(b'{"detail": "metadata part is missing"}', response.body)
+        assert_status_code_equal(response, HTTP_400_BAD_REQUEST)
+        assert b'{"detail": "metadata part is missing"}' == response.body
 
     async def test_handle_missing_prompt_and_response(self):
         """Test that requests missing both prompt and response fields return a 400 Bad Request status code."""
@@ -277,13 +430,11 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_400_BAD_REQUEST)
-        self.assertEqual(
+        assert_status_code_equal(response, HTTP_400_BAD_REQUEST)
+        assert (
             b'{"detail": "input.messages (prompt) and response.choices (response) fields are missing'
-            b' - at least one is required"}',
-            response.body,
-            "expected error message not found",
-        )
+            b' - at least one is required"}'
+        ) == response.body, "expected error message not found"
 
     async def test_handle_malformed_metadata(self):
         """Test that requests with malformed metadata JSON return a 400 Bad Request status code."""
@@ -305,7 +456,7 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_400_BAD_REQUEST)
+        assert_status_code_equal(response, HTTP_400_BAD_REQUEST)
 
         expected_error_msg = (
             "Unable to parse JSON field [metadata]: Unterminated string starting at: "
@@ -313,11 +464,11 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         )
         expected_detail = '{"detail": "' + expected_error_msg + '"}'
         actual_detail = response.body.decode(DEFAULT_ENCODING)
-        self.assertEqual(expected_detail, actual_detail, "expected error message")
+        assert expected_detail == actual_detail, "expected error message"
 
     async def test_handle_valid_prompt_with_none_processor_result(self):
         """Test that a valid prompt with a processor returning None results in a 200 OK response."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(prompt=prompt, metadata=metadata)
         result = Result(processor_result=None)
@@ -325,12 +476,27 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_204_NO_CONTENT)
-        self.assertEqual(b"", response.body, "expected empty body")
+        assert_status_code_equal(response, HTTP_204_NO_CONTENT)
+        assert b"" == response.body, "expected empty body"
+
+    async def test_handle_valid_prompt_with_chunked_body(self):
+        """Test that a valid prompt received over several ASGI body messages is processed."""
+        prompt = TEST_REQ_INPUT_JSON
+        metadata = {"key": "value"}
+        request = fake_multipart_request(
+            prompt=prompt, metadata=metadata, chunk_size=16
+        )
+        result = Result(processor_result=None)
+        processor = fake_processor(result=result)
+
+        response = await processor.handle_request(request)
+
+        assert_status_code_equal(response, HTTP_204_NO_CONTENT)
+        assert b"" == response.body, "expected empty body"
 
     async def test_handle_valid_prompt_with_tags_processor_result(self):
         """Test that a valid prompt with a processor result containing tags properly includes those tags in the response."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -346,18 +512,18 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
-        content = await self.buffer_response(response)
+        assert_status_code_equal(response, HTTP_200_OK)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
         multipart_metadata = multipart.metadata
 
-        self.assertIn("test1", multipart_metadata.content, "expected tags in response")
+        assert "test1" in multipart_metadata.content, "expected tags in response"
 
     async def test_handle_valid_prompt_with_empty_processor_result(self):
         """Test that a valid prompt with an empty processor result returns a 200 OK response with expected content."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(prompt=prompt, metadata=metadata)
         result = Result(modified_prompt=None, metadata=None, processor_result=None)
@@ -365,12 +531,12 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_204_NO_CONTENT)
-        self.assertEqual(b"", response.body, "expected empty body")
+        assert_status_code_equal(response, HTTP_204_NO_CONTENT)
+        assert b"" == response.body, "expected empty body"
 
     async def test_handle_valid_prompt_with_processor_result(self):
         """Test that a valid prompt with a processor result returns a 200 OK response with the expected metadata and content."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -384,39 +550,36 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
-        self.assertFalse(
-            multipart.has_prompt(),
-            "prompt should not be in the response because it was not modified",
+        assert not multipart.has_prompt(), (
+            "prompt should not be in the response because it was not modified"
         )
 
         multipart_metadata = multipart.metadata
-        self.assertEqual(
-            MultipartResponse.JSON_CONTENT_TYPE, multipart_metadata.content_type()
-        )
+        assert MultipartResponse.JSON_CONTENT_TYPE == multipart_metadata.content_type()
         response_metadata = multipart_metadata.as_json()
 
         expected_response_metadata = self.data_loader(
             "multipart_response_metadata.json"
         )
         expected_response_metadata.update(
-            dict(
-                app_details=APP_DETAILS,
-                processor_id=processor.id(),
-                processor_version=processor.version,
-            )
+            {
+                "app_details": APP_DETAILS,
+                "processor_id": processor.id(),
+                "processor_version": processor.version,
+            }
         )
 
-        self.assertDictEqual(expected_response_metadata, response_metadata)
+        assert expected_response_metadata == response_metadata
 
     async def test_handle_rejected_prompt(self):
         """Test that a processor rejecting a prompt returns the expected response with rejection metadata."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value", "step_id": "12345", "request_id": "09876"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -433,36 +596,33 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
 
-        self.assertFalse(
-            multipart.has_prompt(), "the rejected prompt should not be in the response"
+        assert not multipart.has_prompt(), (
+            "the rejected prompt should not be in the response"
         )
 
         multipart_metadata = multipart.metadata
-        self.assertEqual(
-            MultipartResponse.JSON_CONTENT_TYPE, multipart_metadata.content_type()
-        )
+        assert MultipartResponse.JSON_CONTENT_TYPE == multipart_metadata.content_type()
         response_metadata = multipart_metadata.as_json()
 
-        expected_response_metadata = dict(
-            app_details=APP_DETAILS,
-            processor_id=processor.id(),
-            processor_version=processor.version,
-            tags={"test1": ["a", "b"]},
-        )
-        for k, v in metadata.items():
-            expected_response_metadata[k] = v
+        expected_response_metadata = {
+            "app_details": APP_DETAILS,
+            "processor_id": processor.id(),
+            "processor_version": processor.version,
+            "tags": {"test1": ["a", "b"]},
+            **metadata,
+        }
 
-        self.assertDictEqual(expected_response_metadata, response_metadata)
+        assert expected_response_metadata == response_metadata
 
     async def test_handle_rejected_prompt_with_result(self):
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value", "step_id": "12345", "request_id": "09876"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -480,38 +640,35 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
 
-        self.assertFalse(
-            multipart.has_prompt(), "the rejected prompt should not be in the response"
+        assert not multipart.has_prompt(), (
+            "the rejected prompt should not be in the response"
         )
 
         multipart_metadata = multipart.metadata
-        self.assertEqual(
-            MultipartResponse.JSON_CONTENT_TYPE, multipart_metadata.content_type()
-        )
+        assert MultipartResponse.JSON_CONTENT_TYPE == multipart_metadata.content_type()
         response_metadata = multipart_metadata.as_json()
 
-        expected_response_metadata = dict(
-            app_details=APP_DETAILS,
-            processor_id=processor.id(),
-            processor_result={"confidence": 0.99},
-            processor_version=processor.version,
-            tags={"test1": ["a", "b"]},
-        )
-        for k, v in metadata.items():
-            expected_response_metadata[k] = v
+        expected_response_metadata = {
+            "app_details": APP_DETAILS,
+            "processor_id": processor.id(),
+            "processor_result": {"confidence": 0.99},
+            "processor_version": processor.version,
+            "tags": {"test1": ["a", "b"]},
+            **metadata,
+        }
 
-        self.assertDictEqual(expected_response_metadata, response_metadata)
+        assert expected_response_metadata == response_metadata
 
     async def test_handle_modified_prompt(self):
         """Test that a processor modifying a prompt returns the modified prompt in the response."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -530,63 +687,55 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
 
-        self.assertTrue(
-            multipart.has_prompt(),
-            "the rewritten/modified prompt should always be in the response",
+        assert multipart.has_prompt(), (
+            "the rewritten/modified prompt should always be in the response"
         )
 
         multipart_prompt = multipart.prompt
 
-        self.assertEqual(
-            MultipartResponse.JSON_CONTENT_TYPE, multipart_prompt.content_type()
-        )
+        assert MultipartResponse.JSON_CONTENT_TYPE == multipart_prompt.content_type()
         parsed_multipart_content = RequestInput.model_validate_json(
             multipart_prompt.content
         )
-        self.assertEqual(
-            result.modified_prompt,
-            parsed_multipart_content,
-        )
+        assert result.modified_prompt == parsed_multipart_content
 
         multipart_metadata = multipart.metadata
-        self.assertEqual(
-            MultipartResponse.JSON_CONTENT_TYPE, multipart_metadata.content_type()
-        )
+        assert MultipartResponse.JSON_CONTENT_TYPE == multipart_metadata.content_type()
         response_metadata = multipart_metadata.as_json()
 
         expected_response_metadata = self.data_loader(
             "multipart_response_metadata.json"
         )
         expected_response_metadata.update(
-            dict(
-                app_details=APP_DETAILS,
-                processor_id=processor.id(),
-                processor_version=processor.version,
-            )
+            {
+                "app_details": APP_DETAILS,
+                "processor_id": processor.id(),
+                "processor_version": processor.version,
+            }
         )
 
-        self.assertEqual(
-            multipart_metadata.headers["Content-Disposition"],
-            f'form-data; name="{METADATA_NAME}"',
+        assert (
+            multipart_metadata.headers["Content-Disposition"]
+            == f'form-data; name="{METADATA_NAME}"'
         )
-        self.assertEqual(
-            multipart_metadata.headers["Content-Type"],
-            MultipartResponse.JSON_CONTENT_TYPE,
+        assert (
+            multipart_metadata.headers["Content-Type"]
+            == MultipartResponse.JSON_CONTENT_TYPE
         )
         expected_response_metadata["processor_result"]["unit_test"] = "true"
 
-        self.assertDictEqual(expected_response_metadata, response_metadata)
+        assert expected_response_metadata == response_metadata
 
     async def test_handle_unmodified_prompt(self):
         """Test that an unmodified prompt is returned correctly in the response."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -603,50 +752,47 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
 
-        self.assertFalse(
-            multipart.has_prompt(),
-            "the unmodified prompt should not be in the response",
+        assert not multipart.has_prompt(), (
+            "the unmodified prompt should not be in the response"
         )
 
         multipart_metadata = multipart.metadata
-        self.assertEqual(
-            MultipartResponse.JSON_CONTENT_TYPE, multipart_metadata.content_type()
-        )
+        assert MultipartResponse.JSON_CONTENT_TYPE == multipart_metadata.content_type()
         response_metadata = multipart_metadata.as_json()
 
         expected_response_metadata = self.data_loader(
             "multipart_response_metadata.json"
         )
         expected_response_metadata.update(
-            dict(
-                app_details=APP_DETAILS,
-                processor_id=processor.id(),
-                processor_version=processor.version,
-            )
+            {
+                "app_details": APP_DETAILS,
+                "processor_id": processor.id(),
+                "processor_version": processor.version,
+            }
         )
 
-        self.assertEqual(
-            multipart_metadata.headers["Content-Disposition"],
-            f'form-data; name="{METADATA_NAME}"',
+        assert (
+            multipart_metadata.headers["Content-Disposition"]
+            == f'form-data; name="{METADATA_NAME}"'
         )
-        self.assertEqual(
-            multipart_metadata.headers["Content-Type"],
-            MultipartResponse.JSON_CONTENT_TYPE,
+        assert (
+            multipart_metadata.headers["Content-Type"]
+            == MultipartResponse.JSON_CONTENT_TYPE
         )
         expected_response_metadata["processor_result"]["unit_test"] = "true"
 
-        self.assertDictEqual(expected_response_metadata, response_metadata)
+        assert expected_response_metadata == response_metadata
 
     async def test_handle_modification_of_prompt_object(self):
         """Test that direct modification of prompt objects works correctly and is reflected in the response."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -671,24 +817,21 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
 
-        self.assertTrue(
-            multipart.has_prompt(),
-            "prompt should be in the response",
-        )
+        assert multipart.has_prompt(), "prompt should be in the response"
 
         multipart_prompt = multipart.prompt
         assert "Test message" in multipart_prompt.content
 
     async def test_prompt_send_with_file_header(self):
         """Test that prompts with file headers are properly processed."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt, metadata=metadata, with_filenames=True
@@ -698,8 +841,8 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_204_NO_CONTENT)
-        self.assertEqual(b"", response.body, "expected empty body")
+        assert_status_code_equal(response, HTTP_204_NO_CONTENT)
+        assert b"" == response.body, "expected empty body"
 
     def test_to_dict(self):
         """Test that the to_dict method correctly converts processor properties to a dictionary."""
@@ -713,10 +856,8 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         )
         expected["methods"] = ["GET", "HEAD", "POST"]
         actual = processor.to_dict()
-        self.assertDictEqual(
-            expected,
-            actual,
-            "processor conversion to dict did not match expected result",
+        assert expected == actual, (
+            "processor conversion to dict did not match expected result"
         )
 
     def test_name_whitespace_error(self):
@@ -724,14 +865,14 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         expected_message = "Processor name cannot contain whitespace"
         with pytest.raises(ValueError) as err:
             MinimalFakeProcessor("foo bar", "", "", BOTH_SIGNATURE)
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_version_whitespace_error(self):
         """Test that creating a processor with whitespace in the version raises a ValueError."""
         expected_message = "Processor version cannot contain whitespace"
         with pytest.raises(ValueError) as err:
             MinimalFakeProcessor("foo_bar", "1 1", "namespace", BOTH_SIGNATURE)
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_processor_neq_other_type(self):
         """Test that a processor is not equal to objects of other types."""
@@ -740,7 +881,7 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
             pass
 
         processor = MinimalFakeProcessor("foo_bar", "namespace", "1.1", BOTH_SIGNATURE)
-        self.assertNotEqual(processor, Foo())
+        assert processor != Foo()
 
     def test_processor_eq_processor(self):
         """Test that processors with the same properties are considered equal."""
@@ -749,7 +890,7 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         namespace = "namespace"
         processor1 = MinimalFakeProcessor(name, version, namespace, BOTH_SIGNATURE)
         processor2 = MinimalFakeProcessor(name, version, namespace, BOTH_SIGNATURE)
-        self.assertEqual(processor1, processor2)
+        assert processor1 == processor2
 
     @parameterized.expand(
         [
@@ -768,14 +909,12 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         self, signature_fields: Iterable[str], signatures: Iterable[Signature]
     ):
         """Test that valid multipart fields pass validation without errors."""
+        fields: list[tuple[str, str]] = [(s, "") for s in signature_fields]
+        # noinspection PyTypeChecker
+        form_data = FormData(fields)
         for signature in signatures:
             processor = fake_processor(a_signature=signature)
-            fields: list[tuple[str, str]] = list(
-                map(lambda s: (s, ""), signature_fields)
-            )
-            # noinspection PyTypeChecker
-            form_data = FormData(fields)
-            self.assertIsNone(processor._validate_and_find_parameters_name(form_data))
+            assert processor._validate_and_find_parameters_name(form_data) is None
 
     @parameterized.expand(
         [
@@ -796,23 +935,20 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         self, signature_fields: Iterable[str], signatures: Iterable[Signature]
     ):
         """Test that invalid multipart fields raise ValidationError exceptions with appropriate error messages."""
+        fields: list[tuple[str, str]] = [(s, "") for s in signature_fields]
+        # noinspection PyTypeChecker
+        form_data = FormData(fields)
         for signature in signatures:
             processor = fake_processor(a_signature=signature)
-            fields: list[tuple[str, str]] = list(
-                map(lambda s: (s, ""), signature_fields)
-            )
-            # noinspection PyTypeChecker
-            form_data = FormData(fields)
             error_found = False
             try:
                 processor._validate_and_find_parameters_name(form_data)
             except ProcessorError:
                 error_found = True
 
-            self.assertTrue(
-                error_found,
+            assert error_found, (
                 f"ProcessorError was not raised for fields: {signature_fields} "
-                f"and signature: {signature}",
+                f"and signature: {signature}"
             )
 
     def test_no_subclass(self):
@@ -824,7 +960,7 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
             Processor(
                 "attempt-direct-processor-use", "v1", "test", signature=BOTH_SIGNATURE
             )
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_none_implemented(self):
         """Test that a processor subclass that doesn't implement any processing methods raises a TypeError."""
@@ -847,7 +983,7 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
                     )
 
             NonImplementedProcessor()
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_all_implemented(self):
         """Test that a processor subclass that implements all processing methods initializes correctly."""
@@ -878,31 +1014,15 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
                     return Result()
 
             AllImplementedProcessor()
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_async_implemented(self):
         """Test that a processor subclass with async implementations of processing methods initializes correctly."""
-
-        class AsyncImplementedProcessor(Processor):
-            def __init__(self):
-                super().__init__(
-                    name="non-implemented-processor",
-                    namespace="fake",
-                    signature=BOTH_SIGNATURE,
-                    version="v1",
-                )
-
-            async def process_input(self):
-                return Result()
-
-            async def process_response(self):
-                return Result()
-
-        self.assertIsNotNone(AsyncImplementedProcessor())
+        assert AsyncImplementedProcessor() is not None
 
     async def test_async_message(self):
         """Test that async processing methods are properly executed when handling requests."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt,
@@ -910,36 +1030,18 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
             parameters={"modify": True, "annotate": True},
         )
 
-        class AsyncInputProcessor(Processor):
-            def __init__(self):
-                super().__init__(
-                    name="async-input-processor",
-                    namespace="fake",
-                    signature=INPUT_ONLY_SIGNATURE,
-                    version="v1",
-                )
-
-            async def process_input(
-                self, prompt, metadata, parameters, request
-            ) -> Result:
-                prompt.messages.append(Message(content="Test message"))
-                return Result(modified_prompt=prompt)
-
         processor = AsyncInputProcessor()
 
         response = await processor.handle_request(request)
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-        content = await self.buffer_response(response)
+        content = await buffer_response(response)
         multipart = MultipartDecoderHelper(
             content=content, content_type=response.headers["Content-Type"]
         )
 
-        self.assertTrue(
-            multipart.has_prompt(),
-            "prompt should be in the response",
-        )
+        assert multipart.has_prompt(), "prompt should be in the response"
 
         multipart_prompt = multipart.prompt
         assert "Test message" in multipart_prompt.content
@@ -967,23 +1069,10 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
                     return Result()
 
             AsyncProcessImplementedProcessor()
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_input_signature_match(self):
         """Test that a processor with a matching input signature initializes without errors."""
-
-        class InputMatchProcessor(Processor):
-            def __init__(self):
-                super().__init__(
-                    name="non-implemented-processor",
-                    namespace="fake",
-                    signature=INPUT_ONLY_SIGNATURE,
-                    version="v1",
-                )
-
-            def process_input(self):
-                return Result()
-
         InputMatchProcessor()
 
     def test_input_signature_mismatch(self):
@@ -1009,23 +1098,10 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
                     return Result()
 
             InputMismatchProcessor()
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_response_signature_match(self):
         """Test that a processor with a matching response signature initializes without errors."""
-
-        class ResponseMatchProcessor(Processor):
-            def __init__(self):
-                super().__init__(
-                    name="non-implemented-processor",
-                    namespace="fake",
-                    signature=RESPONSE_ONLY_SIGNATURE,
-                    version="v1",
-                )
-
-            def process_response(self):
-                return Result()
-
         ResponseMatchProcessor()
 
     def test_response_signature_mismatch(self):
@@ -1051,61 +1127,15 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
                     return Result()
 
             ResponseMismatchProcessor()
-        self.assertIn(expected_message, err.value.args, str(err.value.args))
+        assert expected_message in err.value.args, str(err.value.args)
 
     def test_deprecated_process_signature_match(self):
         """Test that a processor using the deprecated process signature initializes correctly."""
-
-        class DeprecatedProcessor(Processor):
-            def __init__(self):
-                super().__init__(
-                    name="non-implemented-processor",
-                    namespace="fake",
-                    signature=BOTH_SIGNATURE,
-                    version="v1",
-                )
-
-            def process(self):
-                return Result()
-
         DeprecatedProcessor()
 
-    # HELPER METHODS #
-
-    async def buffer_response(self, response: HttpResponse) -> bytes:
-        self.assertIsInstance(response, MultipartResponse)
-        multipart_response: MultipartResponse = response
-
-        buffer = BytesIO()
-        async for chunk in multipart_response.body_iterator:
-            buffer.write(chunk)
-
-        return buffer.getvalue()
-
-    def assertStatusCodeEqual(self, response: HttpResponse, status_code: int):
-        if not response:
-            self.fail("Response is None")
-
-        self.assertIsInstance(
-            response, HttpResponse, f"Expected HttpResponse, got {type(response)}"
-        )
-
-        if response.status_code != status_code:
-            if not hasattr(response, "body") or isinstance(
-                response.body, HttpStreamingResponse
-            ):
-                self.fail(
-                    f"Expected status code {status_code}, got {response.status_code}"
-                )
-            else:
-                self.fail(
-                    f"Expected status code {status_code}, got {response.status_code}. "
-                    f"Server response: \n{response.body}"
-                )
-
-    async def test_not_allowed_modify_dropped(self):
+    async def test_not_allowed_modify_dropped(self, caplog):
         """Test that attempting to modify a prompt when not allowed results in the modification being dropped."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(prompt=prompt, metadata=metadata)
         result = Result(
@@ -1113,20 +1143,21 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         )
         processor = fake_processor(result=result)
 
-        with self.assertLogs("root", level="WARN") as lw:
-            response = await processor.handle_request(request)
-            self.assertEqual(
-                lw.output,
-                [
-                    "WARNING:root:FakeProcessor tried to modify request when parameters.modify was set to false, modification will be dropped",
-                ],
-            )
+        caplog.set_level(logging.WARNING)
+        response = await processor.handle_request(request)
+        assert [
+            (
+                "root",
+                logging.WARNING,
+                "FakeProcessor tried to modify request when parameters.modify was set to false, modification will be dropped",
+            ),
+        ] == caplog.record_tuples
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-    async def test_not_allowed_annotate_dropped(self):
+    async def test_not_allowed_annotate_dropped(self, caplog):
         """Test that attempting to add annotations when not allowed results in the annotations being dropped."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt, metadata=metadata, parameters={"annotate": False}
@@ -1134,20 +1165,21 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         result = Result(tags=FAKE_TAGS)
         processor = fake_processor(result=result)
 
-        with self.assertLogs("root", level="WARN") as lw:
-            response = await processor.handle_request(request)
-            self.assertEqual(
-                lw.output,
-                [
-                    "WARNING:root:FakeProcessor tried to annotate request with tags when parameters.annotate was set to false, tags will be dropped",
-                ],
-            )
+        caplog.set_level(logging.WARNING)
+        response = await processor.handle_request(request)
+        assert [
+            (
+                "root",
+                logging.WARNING,
+                "FakeProcessor tried to annotate request with tags when parameters.annotate was set to false, tags will be dropped",
+            ),
+        ] == caplog.record_tuples
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
 
-    async def test_not_allowed_reject_dropped(self):
+    async def test_not_allowed_reject_dropped(self, caplog):
         """Test that attempting to reject a prompt when not allowed results in the rejection being ignored."""
-        prompt = TEST_REQ_INPUT.model_dump_json()
+        prompt = TEST_REQ_INPUT_JSON
         metadata = {"key": "value"}
         request = fake_multipart_request(
             prompt=prompt, metadata=metadata, parameters={"reject": False}
@@ -1155,13 +1187,14 @@ class ProcessorTest(unittest.IsolatedAsyncioTestCase):
         result = Reject(code=RejectCode.POLICY_VIOLATION, detail="", tags=FAKE_TAGS)
         processor = fake_processor(result=result)
 
-        with self.assertLogs("root", level="WARN") as lw:
-            response = await processor.handle_request(request)
-            self.assertEqual(
-                lw.output,
-                [
-                    "WARNING:root:FakeProcessor tried to reject request when parameters.reject was set to false, rejection will be dropped",
-                ],
-            )
+        caplog.set_level(logging.WARNING)
+        response = await processor.handle_request(request)
+        assert [
+            (
+                "root",
+                logging.WARNING,
+                "FakeProcessor tried to reject request when parameters.reject was set to false, rejection will be dropped",
+            ),
+        ] == caplog.record_tuples
 
-        self.assertStatusCodeEqual(response, HTTP_200_OK)
+        assert_status_code_equal(response, HTTP_200_OK)
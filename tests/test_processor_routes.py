@@ -7,6 +7,7 @@ LICENSE file in the root directory of this source tree.
 
 import json
 
+import pytest
 from starlette.requests import Request
 
 from f5_ai_gateway_sdk.request_input import RequestInput
@@ -70,12 +71,13 @@ FAKE_PROCESSOR_ONE = FakeProcessorOne()
 FAKE_PROCESSOR_TWO = FakeProcessorTwo()
 
 
-def fake_processor_routes():
+@pytest.fixture(scope="module")
+def processor_routes():
+    """Get a ProcessorRoutes over both fake processors, built once per module."""
     return ProcessorRoutes([FAKE_PROCESSOR_ONE, FAKE_PROCESSOR_TWO])
 
 
-def test_routes_as_plaintext():
-    processor_routes = fake_processor_routes()
+def test_routes_as_plaintext(processor_routes):
     as_plaintext = processor_routes.routes_as_plaintext()
 
     processors = [FAKE_PROCESSOR_ONE, FAKE_PROCESSOR_TWO]
@@ -84,8 +86,7 @@ def test_routes_as_plaintext():
     assert expected == as_plaintext
 
 
-def test_routes_as_json():
-    processor_routes = fake_processor_routes()
+def test_routes_as_json(processor_routes):
     as_json = processor_routes.routes_as_json()
     expected_processor_keys = [
         "name",
@@ -107,12 +108,9 @@ def test_routes_as_json():
             assert key in processor, f"expected {key} in {processor}"
 
 
-def test_list_extensions():
+def test_list_extensions(processor_routes):
     """Verify that ProcessorRoutes implements list-like behaviors such as iteration, indexing, length, membership testing, copying, and equality comparison."""
-    processor_routes = fake_processor_routes()
-    assert (
-        vanilla_order := tuple([proc for proc in iter(processor_routes)])
-    ) == processor_routes._routes
+    assert (vanilla_order := tuple(processor_routes)) == processor_routes._routes
     assert processor_routes[0] == vanilla_order[0]
     assert len(processor_routes) == len(vanilla_order)
     assert vanilla_order[1] in processor_routes
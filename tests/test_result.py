@@ -5,6 +5,8 @@ This source code is licensed under the Apache License Version 2.0 found in the
 LICENSE file in the root directory of this source tree.
 """
 
+from collections.abc import Callable
+
 import pytest
 
 from f5_ai_gateway_sdk.request_input import RequestInput
@@ -26,51 +28,64 @@ def test_prompt_not_allowed_with_response():
 
 
 @pytest.mark.parametrize(
-    "name,annotate,modify,result,expected_log",
+    "name,annotate,modify,result_factory,expected_log",
     [
         (
             "Annotate not allowed",
             False,
             False,
-            Result(tags=Tags({"test": ["value"]})),
+            lambda: Result(tags=Tags({"test": ["value"]})),
             "test_processor tried to annotate request with tags when parameters.annotate was set to false, tags will be dropped",
         ),
-        ("Treat empty Tags as no annotate", False, False, Result(tags=Tags()), ""),
+        (
+            "Treat empty Tags as no annotate",
+            False,
+            False,
+            lambda: Result(tags=Tags()),
+            "",
+        ),
         (
             "Modify not allowed for prompt",
             True,
             False,
-            Result(modified_prompt=RequestInput(messages=[])),
+            lambda: Result(modified_prompt=RequestInput(messages=[])),
             "test_processor tried to modify request when parameters.modify was set to false, modification will be dropped",
         ),
         (
             "Modify not allowed for response",
             True,
             False,
-            Result(modified_response=ResponseOutput(choices=[])),
+            lambda: Result(modified_response=ResponseOutput(choices=[])),
             "test_processor tried to modify request when parameters.modify was set to false, modification will be dropped",
         ),
         (
             "Modify allowed",
             False,
             True,
-            Result(modified_response=ResponseOutput(choices=[])),
+            lambda: Result(modified_response=ResponseOutput(choices=[])),
             "",
         ),
         (
             "Annotate allowed",
             True,
             True,
-            Result(tags=Tags(), modified_prompt=RequestInput(messages=[])),
+            lambda: Result(tags=Tags(), modified_prompt=RequestInput(messages=[])),
             "",
         ),
     ],
     ids=lambda name: name,
 )
 def test_validate_not_allowed_parameters(
-    caplog, name, annotate: bool, modify: bool, result: Result, expected_log
+    caplog,
+    name,
+    annotate: bool,
+    modify: bool,
+    result_factory: Callable[[], Result],
+    expected_log,
 ):
     """Test validate_allowed drops modifications or tags which have not been approved."""
+    # - validate_allowed edits the result in place, so every run gets a fresh one
+    result = result_factory()
     result.validate_allowed("test_processor", annotate, modify)
 
     if expected_log:
@@ -25,9 +25,10 @@ test_signatures = [
     RESPONSE_AND_PROMPT_SIGNATURE,
     INPUT_ONLY_SIGNATURE,
 ]
+with_each_signature = pytest.mark.parametrize("signature", test_signatures)
 
 
-@pytest.mark.parametrize("signature", test_signatures)
+@with_each_signature
 def test_can_serialize_to_json(signature: Signature):
     """
     Test that the various signature types can be serialized to JSON.
@@ -50,7 +51,7 @@ def test_can_serialize_to_json(signature: Signature):
             assert signature_value is not None
 
 
-@pytest.mark.parametrize("signature", test_signatures)
+@with_each_signature
 def test_supports_direction(signature: Signature):
     """
     Test that the signature correctly reports if it supports either input or response.
@@ -12,21 +12,22 @@ import pytest
 
 
 def test_tags_init():
-    """Test that Tags initializes correctly with various valid inputs and raises appropriate errors for invalid inputs."""
+    """Test that Tags initializes correctly with various valid inputs."""
     assert isinstance(Tags(), Tags)
     assert isinstance(Tags({}), Tags)
     assert isinstance(Tags({"a": ["b"]}), Tags)
     assert isinstance(Tags({"a": ["b"], "c": ["d", "e"]}), Tags)
 
-    def check_arg_error(arg):
-        with pytest.raises((AttributeError, TypeError)):
-            Tags(arg)
 
-    check_arg_error([])
-    check_arg_error({"a": "b"})
-    check_arg_error({"a": []})
-    check_arg_error({"a": [True]})
-    check_arg_error({"a": [{}]})
+@pytest.mark.parametrize(
+    "arg",
+    [[], {"a": "b"}, {"a": []}, {"a": [True]}, {"a": [{}]}],
+    ids=["list", "str_value", "empty_list_value", "bool_tag", "dict_tag"],
+)
+def test_tags_init_invalid(arg):
+    """Test that Tags raises an error for each kind of invalid input."""
+    with pytest.raises((AttributeError, TypeError)):
+        Tags(arg)
 
 
 def test_tags_modify():